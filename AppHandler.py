@@ -10,7 +10,7 @@ Licencia: MIT License
 import wx
 from DBManager import (DBManager, DatabaseError, BookCreationError, BookUpdateError, BookNotFoundError, BookDeletionError,
                      ChapterCreationError, ChapterUpdateError, ChapterNotFoundError, ChapterDeletionError,
-                     ConcreteIdeaError)
+                     ConcreteIdeaError, DBRow)
 from typing import Callable, List, Dict, Optional, Any
 
 class AppHandler:
@@ -156,16 +156,16 @@ class AppHandler:
             wx.MessageBox(f"Un error inesperado ocurrió al crear el libro: {e_gen}", "Error Inesperado", wx.OK | wx.ICON_ERROR, parent=self.main_window)
         return None # Retorna None si la creación falla
 
-    def get_all_books(self) -> List[Dict[str, Any]]:
+    def get_all_books(self) -> List[DBRow]:
         """
         Obtiene una lista de todos los libros almacenados en la base de datos.
 
         Delega la consulta al DBManager. Maneja errores de base de datos.
 
         Returns:
-            List[Dict[str, Any]]: Una lista de diccionarios, donde cada diccionario
-                                  representa un libro con sus detalles. Retorna una
-                                  lista vacía si ocurre un error.
+            List[DBRow]: Una lista de filas de solo lectura (acceso por nombre de
+                         columna y get()), donde cada fila representa un libro con
+                         sus detalles. Retorna una lista vacía si ocurre un error.
         """
         try:
             return self.db_manager.get_all_books() # Llama al DBManager para obtener todos los libros
@@ -230,7 +230,7 @@ class AppHandler:
             return False # Retorna False si la actualización falla
 
     # --- Métodos para Capítulos ---
-    def get_chapters_by_book_id(self, book_id: int) -> List[Dict[str, Any]]:
+    def get_chapters_by_book_id(self, book_id: int) -> List[DBRow]:
         """
         Obtiene una lista de todos los capítulos asociados a un libro específico.
 
@@ -240,9 +240,10 @@ class AppHandler:
             book_id (int): El identificador único del libro cuyos capítulos se desean obtener.
 
         Returns:
-            List[Dict[str, Any]]: Una lista de diccionarios, donde cada diccionario
-                                  representa un capítulo. Retorna una lista vacía
-                                  si el libro no tiene capítulos o si ocurre un error.
+            List[DBRow]: Una lista de filas de solo lectura (acceso por nombre de
+                         columna y get()), donde cada fila representa un capítulo.
+                         Retorna una lista vacía si el libro no tiene capítulos o si
+                         ocurre un error.
         """
         try:
             return self.db_manager.get_chapters_by_book_id(book_id) # Llama al DBManager para obtener capítulos por libro
@@ -391,7 +392,7 @@ class AppHandler:
             return False # Retorna False en caso de error
 
     # --- Métodos para Ideas Concretas ---
-    def get_concrete_ideas_for_chapter(self, chapter_id: int) -> List[Dict[str, Any]]:
+    def get_concrete_ideas_for_chapter(self, chapter_id: int) -> List[DBRow]:
         """
         Obtiene una lista de todas las ideas concretas asociadas a un capítulo específico.
 
@@ -401,9 +402,10 @@ class AppHandler:
             chapter_id (int): El identificador único del capítulo cuyas ideas concretas se desean obtener.
 
         Returns:
-            List[Dict[str, Any]]: Una lista de diccionarios, donde cada diccionario
-                                  representa una idea concreta. Retorna una lista vacía
-                                  si el capítulo no tiene ideas concretas o si ocurre un error.
+            List[DBRow]: Una lista de filas de solo lectura (acceso por nombre de
+                         columna y get()), donde cada fila representa una idea concreta.
+                         Retorna una lista vacía si el capítulo no tiene ideas concretas
+                         o si ocurre un error.
         """
         try:
             return self.db_manager.get_concrete_ideas_by_chapter_id(chapter_id) # Llama al DBManager para obtener ideas concretas por capítulo
@@ -8,7 +8,6 @@ Versión: 0.0.1
 Licencia: MIT License
 """
 import wx
-import wx.adv
 from typing import Optional, List, Tuple as TypingTuple, Dict, Any, Callable
 import os
 import sys
@@ -41,6 +40,8 @@ class ChapterContentView(wx.Panel):
     font_sizes: List[str]
     text_styles_map: Dict[str, Dict[str, Any]]
     default_font: wx.Font
+    _default_point_size: int
+    _default_face_name: str
     edit_tool_icon: Optional[wx.Bitmap]
 
     # --- Declaraciones de Atributos de Instancia (Type Hinting) ---
@@ -49,6 +50,10 @@ class ChapterContentView(wx.Panel):
     _is_dirty_view: bool
     _loading_data: bool
     _is_in_edit_mode: bool
+    _pending_modifiers: List[Callable[[wx.TextAttr], None]]
+    _flush_scheduled: bool
+    _colour_modifier_cache: Dict[int, Callable[[wx.TextAttr], None]]
+    _colour_cache: Dict[str, wx.Colour]
 
     content_label: Optional[wx.StaticText]
     content_ctrl: Optional[wx.TextCtrl]
@@ -82,6 +87,10 @@ class ChapterContentView(wx.Panel):
         self._is_dirty_view = False # Indica si el contenido actual tiene cambios sin guardar
         self._loading_data = False # Bandera para evitar marcar como sucio durante la carga inicial
         self._is_in_edit_mode = False # Indica si el panel está en modo edición
+        self._pending_modifiers = [] # Modificadores de formato pendientes de aplicar en el próximo ciclo
+        self._flush_scheduled = False # Indica si ya hay una aplicación de formato programada con CallAfter
+        self._colour_modifier_cache = {} # Modificadores de color ya construidos, por valor RGBA
+        self._colour_cache = {} # Instancias de wx.Colour de los estilos predefinidos, por cadena de color
 
         # Define los tamaños de fuente disponibles en la barra de herramientas
         font_size_values: List[int]
@@ -110,6 +119,11 @@ class ChapterContentView(wx.Panel):
             if not (9 <= current_ps <= 14):
                 self.default_font.SetPointSize(11)
 
+        # Guarda el tamaño y la familia de la fuente por defecto (no cambian durante la sesión)
+        # para no consultarlos a wx en cada aplicación de estilo o serialización
+        self._default_point_size = self.default_font.GetPointSize()
+        self._default_face_name = self.default_font.GetFaceName()
+
         self.edit_tool_icon = None
 
         # Crea y organiza los controles de la UI
@@ -194,10 +208,10 @@ class ChapterContentView(wx.Panel):
         if font.IsOk():
             face_name: str = font.GetFaceName(); point_size: int = font.GetPointSize()
             default_sys_font_face: str = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT).GetFaceName()
-            is_custom_face: bool = face_name and face_name.lower() != default_sys_font_face.lower() and face_name.lower() != self.default_font.GetFaceName().lower()
+            is_custom_face: bool = face_name and face_name.lower() != default_sys_font_face.lower() and face_name.lower() != self._default_face_name.lower()
             if is_custom_face: open_tag_parts.append(f' face="{face_name}"'); has_font_attrs = True
             # Añade el tamaño como atributo 'data-point-size' para parseo posterior
-            is_custom_size: bool = point_size != self.default_font.GetPointSize()
+            is_custom_size: bool = point_size != self._default_point_size
             if is_custom_size: open_tag_parts.append(f' data-point-size="{point_size}"'); has_font_attrs = True
         # Verifica y añade el atributo 'color' si el color es diferente al negro
         is_custom_color: bool = color.IsOk() and color != wx.BLACK
@@ -1029,6 +1043,107 @@ class ChapterContentView(wx.Panel):
         # Actualiza el estado de la barra de herramientas para reflejar el nuevo estilo
         wx.CallAfter(self._update_format_toolbar_state, True)
 
+    def _schedule_apply(self, attr_modifier: Callable[[wx.TextAttr], None]):
+        """
+        Encola una modificación de atributo de texto para aplicarla de forma
+        agrupada en el próximo ciclo del bucle de eventos.
+
+        Si varios eventos de formato llegan en rápida sucesión (ej. negrita y
+        cursiva seguidas), todos los modificadores se combinan y se aplican con
+        una única llamada a `_apply_text_attribute`, evitando recalcular el
+        estilo y el layout del TextCtrl una vez por evento.
+
+        Args:
+            attr_modifier (Callable[[wx.TextAttr], None]): La función modificadora
+                                                          a encolar.
+        """
+        self._pending_modifiers.append(attr_modifier)
+        # Programa la aplicación solo una vez por ráfaga de eventos
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            wx.CallAfter(self._flush_modifiers)
+
+    def _flush_modifiers(self):
+        """
+        Aplica de una sola vez todas las modificaciones de formato encoladas
+        mediante `_schedule_apply`, en el orden en que fueron recibidas.
+        """
+        pending: List[Callable[[wx.TextAttr], None]] = self._pending_modifiers
+        self._pending_modifiers = []
+        self._flush_scheduled = False
+        if not pending: return
+
+        # Compone todos los modificadores pendientes en uno solo
+        def composed_modifier(attr: wx.TextAttr):
+            for pending_modifier in pending:
+                pending_modifier(attr)
+
+        self._apply_text_attribute(composed_modifier)
+
+    def _font_modifier(self, *, facename: Optional[str] = None, point_size: Optional[int] = None,
+                       bold: Optional[bool] = None, italic: Optional[bool] = None,
+                       underlined: Optional[bool] = None,
+                       colour: Optional[wx.Colour] = None,
+                       clear_underline_flag: bool = False) -> Callable[[wx.TextAttr], None]:
+        """
+        Construye una función modificadora de atributos que aplica solo las
+        propiedades indicadas (las que no son None) sobre la fuente y el color
+        del atributo recibido.
+
+        Centraliza la lógica compartida por los manejadores de formato: tomar
+        la fuente existente (o la fuente por defecto como base), modificarla,
+        asignarla y mantener activos los flags correspondientes.
+
+        Args:
+            facename (Optional[str]): Familia de fuente a establecer.
+            point_size (Optional[int]): Tamaño de fuente en puntos.
+            bold (Optional[bool]): True para negrita, False para peso normal.
+            italic (Optional[bool]): True para cursiva, False para estilo normal.
+            underlined (Optional[bool]): Estado de subrayado.
+            colour (Optional[wx.Colour]): Color de texto a establecer.
+            clear_underline_flag (bool): Si es True y underlined es False, desactiva el
+                flag de subrayado en lugar de aplicarlo con valor False (comportamiento
+                del botón de Subrayado). Los estilos predefinidos lo dejan en False para
+                que su "sin subrayado" se aplique y quite un subrayado existente.
+
+        Returns:
+            Callable[[wx.TextAttr], None]: La función modificadora resultante.
+        """
+        changes_font: bool = (facename is not None or point_size is not None or bold is not None
+                              or italic is not None or underlined is not None)
+
+        # Calcula de antemano qué flags activar y cuáles desactivar, para
+        # actualizarlos todos con un único GetFlags/SetFlags por modificación.
+        # Los flags de fuente no se añaden: SetFont ya activa los que corresponden,
+        # y wx.TEXT_ATTR_FONT incluye TEXT_ATTR_FONT_PIXEL_SIZE, con el que GetFont
+        # interpretaría el tamaño en puntos como píxeles
+        set_mask: int = 0
+        clear_mask: int = 0
+        if colour is not None: set_mask = wx.TEXT_ATTR_TEXT_COLOUR
+        if underlined is False and clear_underline_flag: clear_mask = wx.TEXT_ATTR_FONT_UNDERLINE
+        elif underlined is not None: set_mask |= wx.TEXT_ATTR_FONT_UNDERLINE
+
+        def modifier(attr: wx.TextAttr):
+            if changes_font:
+                font: wx.Font
+                if attr.HasFont(): font = attr.GetFont() # Usa la fuente existente si la hay
+                else: font = wx.Font(self.default_font) # Si no, usa la fuente por defecto como base
+                if facename is not None: font.SetFaceName(facename)
+                if point_size is not None: font.SetPointSize(point_size)
+                if bold is not None: font.SetWeight(wx.FONTWEIGHT_BOLD if bold else wx.FONTWEIGHT_NORMAL)
+                if italic is not None: font.SetStyle(wx.FONTSTYLE_ITALIC if italic else wx.FONTSTYLE_NORMAL)
+                if underlined is not None: font.SetUnderlined(underlined)
+                attr.SetFont(font) # Aplica la fuente modificada al atributo
+
+            if colour is not None:
+                attr.SetTextColour(colour) # Establece el color de texto en el atributo
+
+            # Actualiza todos los flags afectados en una sola llamada; se leen
+            # después de SetFont/SetTextColour para no pisar los que estos activan
+            attr.SetFlags((attr.GetFlags() | set_mask) & ~clear_mask)
+
+        return modifier
+
     # --- Manejadores de eventos para formato ---
     def on_font_facename_selected(self, event: wx.CommandEvent):
         """
@@ -1044,18 +1159,8 @@ class ChapterContentView(wx.Panel):
         selected_facename: str = self.font_facename_combo.GetStringSelection()
         if not selected_facename: return # No hace nada si no hay selección válida
 
-        # Define la función modificadora de atributos
-        def modifier(attr: wx.TextAttr):
-            font: wx.Font
-            if attr.HasFont(): font = attr.GetFont() # Usa la fuente existente si la hay
-            else: font = wx.Font(self.default_font) # Si no, usa la fuente por defecto como base
-            font.SetFaceName(selected_facename) # Establece la nueva familia de fuente
-            attr.SetFont(font) # Aplica la fuente modificada al atributo
-            # Asegura que el flag de fuente esté activo en el atributo
-            if not attr.HasFont(): current_flags:int=attr.GetFlags(); new_flags:int=current_flags|wx.TEXT_ATTR_FONT; attr.SetFlags(new_flags)
-
-        # Aplica la modificación usando el método auxiliar
-        self._apply_text_attribute(modifier)
+        # Encola la modificación junto con los demás eventos de formato para respetar su orden
+        self._schedule_apply(self._font_modifier(facename=selected_facename))
 
     def on_font_size_selected(self, event: wx.CommandEvent):
         """
@@ -1072,18 +1177,8 @@ class ChapterContentView(wx.Panel):
         try: size: int = int(size_str) # Convierte el tamaño a entero
         except ValueError: return # Ignora si la selección no es un número válido
 
-        # Define la función modificadora de atributos
-        def modifier(attr: wx.TextAttr):
-            font: wx.Font
-            if attr.HasFont(): font = attr.GetFont() # Usa la fuente existente si la hay
-            else: font = wx.Font(self.default_font) # Si no, usa la fuente por defecto como base
-            font.SetPointSize(size) # Establece el nuevo tamaño de fuente
-            attr.SetFont(font) # Aplica la fuente modificada al atributo
-            # Asegura que el flag de fuente esté activo en el atributo
-            if not attr.HasFont(): current_flags:int=attr.GetFlags(); new_flags:int=current_flags|wx.TEXT_ATTR_FONT; attr.SetFlags(new_flags)
-
-        # Aplica la modificación usando el método auxiliar
-        self._apply_text_attribute(modifier)
+        # Encola la modificación junto con los demás eventos de formato para respetar su orden
+        self._schedule_apply(self._font_modifier(point_size=size))
 
     def on_format_bold(self, event: wx.CommandEvent):
         """
@@ -1098,19 +1193,8 @@ class ChapterContentView(wx.Panel):
         if self.format_toolbar is None: return
         is_checked: bool = self.format_toolbar.GetToolState(ID_FORMAT_BOLD) # Obtiene el estado actual del botón (marcado/desmarcado)
 
-        # Define la función modificadora de atributos
-        def modifier(attr: wx.TextAttr):
-            font: wx.Font
-            if attr.HasFont(): font = attr.GetFont() # Usa la fuente existente si la hay
-            else: font = wx.Font(self.default_font) # Si no, usa la fuente por defecto como base
-            if is_checked: font.SetWeight(wx.FONTWEIGHT_BOLD) # Si el botón está marcado, aplica negrita
-            else: font.SetWeight(wx.FONTWEIGHT_NORMAL) # Si no, aplica peso normal
-            attr.SetFont(font) # Aplica la fuente modificada al atributo
-            # Asegura que el flag de fuente esté activo en el atributo
-            if not attr.HasFont(): current_flags:int=attr.GetFlags(); new_flags:int=current_flags|wx.TEXT_ATTR_FONT; attr.SetFlags(new_flags)
-
-        # Aplica la modificación usando el método auxiliar
-        self._apply_text_attribute(modifier)
+        # Encola la modificación para aplicarla agrupada con otros eventos de formato
+        self._schedule_apply(self._font_modifier(bold=is_checked))
 
     def on_format_italic(self, event: wx.CommandEvent):
         """
@@ -1125,19 +1209,8 @@ class ChapterContentView(wx.Panel):
         if self.format_toolbar is None: return
         is_checked: bool = self.format_toolbar.GetToolState(ID_FORMAT_ITALIC) # Obtiene el estado actual del botón
 
-        # Define la función modificadora de atributos
-        def modifier(attr: wx.TextAttr):
-            font: wx.Font
-            if attr.HasFont(): font = attr.GetFont() # Usa la fuente existente si la hay
-            else: font = wx.Font(self.default_font) # Si no, usa la fuente por defecto como base
-            if is_checked: font.SetStyle(wx.FONTSTYLE_ITALIC) # Si el botón está marcado, aplica cursiva
-            else: font.SetStyle(wx.FONTSTYLE_NORMAL) # Si no, aplica estilo normal
-            attr.SetFont(font) # Aplica la fuente modificada al atributo
-            # Asegura que el flag de fuente esté activo en el atributo
-            if not attr.HasFont(): current_flags:int=attr.GetFlags(); new_flags:int=current_flags|wx.TEXT_ATTR_FONT; attr.SetFlags(new_flags)
-
-        # Aplica la modificación usando el método auxiliar
-        self._apply_text_attribute(modifier)
+        # Encola la modificación para aplicarla agrupada con otros eventos de formato
+        self._schedule_apply(self._font_modifier(italic=is_checked))
 
     def on_format_underline(self, event: wx.CommandEvent):
         """
@@ -1152,27 +1225,8 @@ class ChapterContentView(wx.Panel):
         if self.format_toolbar is None: return
         is_checked: bool = self.format_toolbar.GetToolState(ID_FORMAT_UNDERLINE) # Obtiene el estado actual del botón
 
-        # Define la función modificadora de atributos
-        def modifier(attr: wx.TextAttr):
-            font: wx.Font
-            if attr.HasFont(): font = attr.GetFont() # Usa la fuente existente si la hay
-            else: font = wx.Font(self.default_font) # Si no, usa la fuente por defecto como base
-            font.SetUnderlined(is_checked) # Establece el estado de subrayado en la fuente
-            attr.SetFont(font) # Aplica la fuente modificada al atributo
-
-            # Actualiza el flag de subrayado en el atributo
-            current_flags: int = attr.GetFlags(); new_flags: int
-            if is_checked: new_flags = current_flags | wx.TEXT_ATTR_FONT_UNDERLINE
-            else: new_flags = current_flags & ~wx.TEXT_ATTR_FONT_UNDERLINE
-            attr.SetFlags(new_flags)
-
-            # Asegura que el flag de fuente esté activo en el atributo
-            if not attr.HasFont():
-                current_flags_after:int=attr.GetFlags(); new_flags_after:int=current_flags_after|wx.TEXT_ATTR_FONT
-                attr.SetFlags(new_flags_after)
-
-        # Aplica la modificación usando el método auxiliar
-        self._apply_text_attribute(modifier)
+        # Encola la modificación para aplicarla agrupada con otros eventos de formato
+        self._schedule_apply(self._font_modifier(underlined=is_checked, clear_underline_flag=True))
 
     def on_font_colour_picked(self, event: wx.ColourPickerEvent):
         """
@@ -1186,14 +1240,15 @@ class ChapterContentView(wx.Panel):
         """
         colour: wx.Colour = event.GetColour() # Obtiene el color seleccionado
 
-        # Define la función modificadora de atributos
-        def modifier(attr: wx.TextAttr):
-            attr.SetTextColour(colour) # Establece el color de texto en el atributo
-            # Asegura que el flag de color de texto esté activo en el atributo
-            if not attr.HasTextColour(): current_flags:int=attr.GetFlags(); new_flags:int=current_flags|wx.TEXT_ATTR_TEXT_COLOUR; attr.SetFlags(new_flags)
+        # Reutiliza el modificador si este color ya se eligió antes
+        rgba: int = colour.GetRGBA()
+        modifier: Optional[Callable[[wx.TextAttr], None]] = self._colour_modifier_cache.get(rgba)
+        if modifier is None:
+            modifier = self._font_modifier(colour=wx.Colour(colour))
+            self._colour_modifier_cache[rgba] = modifier
 
-        # Aplica la modificación usando el método auxiliar
-        self._apply_text_attribute(modifier)
+        # Encola la modificación para aplicarla agrupada con otros eventos de formato
+        self._schedule_apply(modifier)
 
     def on_text_style_selected(self, event: wx.CommandEvent):
         """
@@ -1211,47 +1266,30 @@ class ChapterContentView(wx.Panel):
 
         if not style_props: return # No hace nada si el nombre del estilo no es válido
 
-        # Define la función modificadora de atributos
-        def modifier(attr: wx.TextAttr):
-            font: wx.Font
-            if attr.HasFont(): font = attr.GetFont() # Usa la fuente existente si la hay
-            else: font = wx.Font(self.default_font) # Si no, usa la fuente por defecto como base
-
-            # Aplica el tamaño de fuente según las propiedades del estilo
-            point_size_prop: Optional[int] = style_props.get("point_size")
-            size_delta_prop: Optional[int] = style_props.get("size_delta")
-            if point_size_prop is not None: font.SetPointSize(point_size_prop) # Si se especifica un tamaño absoluto
-            elif size_delta_prop is not None: # Si se especifica un delta respecto al tamaño por defecto
-                new_size: int = self.default_font.GetPointSize() + size_delta_prop
-                font.SetPointSize(new_size)
-
-            # Aplica el peso (negrita) según las propiedades del estilo
-            is_bold_prop: bool = style_props.get("bold",False)
-            if is_bold_prop: font.SetWeight(wx.FONTWEIGHT_BOLD)
-            else: font.SetWeight(wx.FONTWEIGHT_NORMAL)
-
-            # Aplica el estilo (cursiva) según las propiedades del estilo
-            is_italic_prop: bool = style_props.get("italic",False)
-            if is_italic_prop: font.SetStyle(wx.FONTSTYLE_ITALIC)
-            else: font.SetStyle(wx.FONTSTYLE_NORMAL)
-
-            # Aplica el subrayado según las propiedades del estilo
-            is_underline_prop: bool = style_props.get("underline",False)
-            font.SetUnderlined(is_underline_prop)
-
-            attr.SetFont(font) # Aplica la fuente modificada al atributo
-            # Asegura que el flag de fuente esté activo
-            if not attr.HasFont(): current_flags_font:int=attr.GetFlags(); attr.SetFlags(current_flags_font|wx.TEXT_ATTR_FONT)
-
-            # Aplica el color de texto según las propiedades del estilo
-            color_str: Optional[str] = style_props.get("color")
-            if color_str:
-                attr.SetTextColour(wx.Colour(color_str))
-                # Asegura que el flag de color de texto esté activo
-                if not attr.HasTextColour(): current_flags_color:int=attr.GetFlags(); attr.SetFlags(current_flags_color|wx.TEXT_ATTR_TEXT_COLOUR)
-
-        # Aplica la modificación usando el método auxiliar
-        self._apply_text_attribute(modifier)
+        # Calcula el tamaño de fuente según las propiedades del estilo
+        point_size: Optional[int] = style_props.get("point_size")
+        size_delta_prop: Optional[int] = style_props.get("size_delta")
+        if point_size is None and size_delta_prop is not None:
+            # Si se especifica un delta respecto al tamaño por defecto
+            point_size = self._default_point_size + size_delta_prop
+
+        # Obtiene el color de texto del estilo, si lo define (reutilizando la instancia ya creada)
+        color_str: Optional[str] = style_props.get("color")
+        colour: Optional[wx.Colour] = None
+        if color_str:
+            colour = self._colour_cache.get(color_str)
+            if colour is None:
+                colour = wx.Colour(color_str)
+                self._colour_cache[color_str] = colour
+
+        # Encola la modificación para aplicarla agrupada con otros eventos de formato
+        self._schedule_apply(self._font_modifier(
+            point_size=point_size,
+            bold=style_props.get("bold", False),
+            italic=style_props.get("italic", False),
+            underlined=style_props.get("underline", False),
+            colour=colour,
+        ))
 
     def is_editable(self) -> bool:
         """
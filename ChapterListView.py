@@ -8,12 +8,25 @@ Version: 0.0.1
 License: MIT License
 """
 import wx
-from typing import Optional, List, Dict, Any, Callable
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Callable, Tuple
 
 # Definición de IDs para los botones
 ID_ADD_CHAPTER = wx.NewIdRef()
 ID_DELETE_CHAPTER = wx.NewIdRef()
 
+@dataclass
+class ChapterRow:
+    """
+    Fila ligera con los datos de un capítulo que muestra la lista.
+    Usa __slots__ para que el acceso a los campos sea por atributo y no por
+    búsqueda en diccionario.
+    """
+    __slots__ = ('id', 'chapter_number', 'title')
+    id: int
+    chapter_number: int
+    title: str
+
 class ChapterListView(wx.Panel):
     """
     Panel de wxPython que muestra una lista de capítulos asociados a un libro
@@ -33,10 +46,21 @@ class ChapterListView(wx.Panel):
         self.app_handler = app_handler
         # ID del libro actualmente cargado (None si no hay libro seleccionado)
         self.book_id: Optional[int] = None
-        # Lista de diccionarios que representan los datos de los capítulos cargados
-        self.chapters_data: List[Dict[str, Any]] = []
+        # Filas con los datos de los capítulos cargados, en el orden de la lista visual
+        self.chapters_data: List[ChapterRow] = []
+        # Mapa ID de capítulo -> índice en la lista visual, para búsquedas O(1)
+        self._id_to_index: Dict[int, int] = {}
+        # Número de capítulo más alto del libro cargado (0 si no hay capítulos)
+        self._max_chapter_number: int = 0
+        # Caché de etiquetas ya formateadas por ID de libro para no consultar la BD en cada recarga
+        self._book_label_cache: Dict[int, str] = {}
+        # Último estado de habilitación aplicado (Añadir, Eliminar, Lista), para no repetir llamadas
+        self._last_btn_state: Optional[Tuple[bool, bool, bool]] = None
         # Callback a ejecutar cuando se selecciona un capítulo
         self.on_chapter_selected_callback: Optional[Callable[[Optional[int]], None]] = None
+        # Último ID notificado al callback y si ya se ha notificado alguno, para no repetir "sin selección"
+        self._last_notified_chapter_id: Optional[int] = None
+        self._has_notified: bool = False
 
         # Crea los controles visuales
         self._create_controls()
@@ -54,8 +78,9 @@ class ChapterListView(wx.Panel):
         self.list_label = wx.StaticText(self, label="Capítulos del Libro:")
         # Control ListBox para mostrar los nombres de los capítulos
         # wx.LB_SINGLE: Permite seleccionar solo un elemento a la vez.
-        # wx.LB_SORT: Mantiene los elementos ordenados alfabéticamente.
-        self.chapter_list_ctrl = wx.ListBox(self, style=wx.LB_SINGLE | wx.LB_SORT)
+        # No se usa wx.LB_SORT: los capítulos se ordenan una sola vez en Python por
+        # número de capítulo (el control ordenaba alfabéticamente en cada Append).
+        self.chapter_list_ctrl = wx.ListBox(self, style=wx.LB_SINGLE)
         # Botón para añadir un nuevo capítulo
         self.add_chapter_button = wx.Button(self, ID_ADD_CHAPTER, "Añadir Capítulo")
         # Botón para eliminar el capítulo seleccionado
@@ -114,12 +139,81 @@ class ChapterListView(wx.Panel):
         # Verifica si hay algún elemento seleccionado
         has_selection = selection_index != wx.NOT_FOUND
 
+        # Si el estado no ha cambiado desde la última vez, no hay nada que aplicar
+        new_state = (has_book, has_book and has_selection, has_book)
+        if new_state == self._last_btn_state:
+            return
+        self._last_btn_state = new_state
+
         # Habilita el botón Añadir solo si hay un libro cargado
-        self.add_chapter_button.Enable(has_book)
+        self.add_chapter_button.Enable(new_state[0])
         # Habilita el botón Eliminar solo si hay un libro cargado Y un capítulo seleccionado
-        self.delete_chapter_button.Enable(has_book and has_selection)
+        self.delete_chapter_button.Enable(new_state[1])
         # Habilita la lista de capítulos solo si hay un libro cargado
-        self.chapter_list_ctrl.Enable(has_book)
+        self.chapter_list_ctrl.Enable(new_state[2])
+
+    def _append_chapter_row(self, chapter: ChapterRow) -> int:
+        """
+        Añade un capítulo al final de los datos internos y de la lista visual,
+        manteniendo sincronizados el mapa de índices y el número de capítulo máximo.
+
+        Args:
+            chapter (ChapterRow): Los datos del capítulo a añadir.
+
+        Returns:
+            int: El índice del capítulo en la lista visual.
+        """
+        self.chapters_data.append(chapter)
+        # Formatea el texto a mostrar en la lista
+        display_text = f"Cap. {chapter.chapter_number}: {chapter.title}"
+        # Añade el texto a la lista, asociando el ID del capítulo como ClientData
+        new_index = self.chapter_list_ctrl.Append(display_text, chapter.id)
+        # Registra el índice del capítulo (coincide con el orden de inserción)
+        self._id_to_index[chapter.id] = new_index
+        # Mantiene actualizado el número de capítulo más alto
+        if chapter.chapter_number > self._max_chapter_number:
+            self._max_chapter_number = chapter.chapter_number
+        return new_index
+
+    def _remove_chapter_row(self, index: int, chapter_id: int):
+        """
+        Quita un capítulo de los datos internos y de la lista visual sin recargar
+        desde la base de datos. Si el estado visual no coincide con los datos
+        internos, recurre a una recarga completa.
+
+        Args:
+            index (int): El índice del capítulo en la lista visual.
+            chapter_id (int): El ID del capítulo eliminado.
+        """
+        # Si la lista visual no está sincronizada con los datos, recarga todo
+        if self._id_to_index.get(chapter_id) != index or index >= len(self.chapters_data):
+            self.load_chapters(self.book_id)
+            return
+
+        # Elimina la fila de la lista visual y de los datos internos
+        self.chapter_list_ctrl.Delete(index)
+        del self.chapters_data[index]
+        # Reasigna los índices de las filas posteriores a la eliminada
+        self._id_to_index = {chapter.id: i for i, chapter in enumerate(self.chapters_data)}
+        # Recalcula el número de capítulo más alto (puede haberse eliminado el último)
+        self._max_chapter_number = max((c.chapter_number for c in self.chapters_data), default=0)
+
+        # Actualiza el estado de los botones basado en la nueva lista
+        self._update_button_states()
+
+        # Tras eliminar la fila seleccionada no queda selección; lo notifica al callback
+        if self.chapter_list_ctrl.GetSelection() == wx.NOT_FOUND:
+            self._notify_no_selection()
+
+    def invalidate_book_title(self, book_id: int):
+        """
+        Descarta la etiqueta en caché de un libro, por ejemplo tras renombrarlo,
+        para que la próxima carga de capítulos vuelva a consultar su título.
+
+        Args:
+            book_id (int): El ID del libro cuyo título se descarta.
+        """
+        self._book_label_cache.pop(book_id, None)
 
     def load_chapters(self, book_id: Optional[int]):
         """
@@ -132,45 +226,63 @@ class ChapterListView(wx.Panel):
         """
         # Almacena el ID del libro actual
         self.book_id = book_id
-        # Limpia la lista visual de capítulos
-        self.chapter_list_ctrl.Clear()
         # Limpia los datos internos de los capítulos
         self.chapters_data.clear()
+        self._id_to_index.clear()
+        self._max_chapter_number = 0
 
         # Si no hay libro seleccionado, actualiza la etiqueta y el estado, y notifica al callback
         if self.book_id is None:
+            # Limpia la lista visual de capítulos
+            self.chapter_list_ctrl.Clear()
             self.list_label.SetLabel("Capítulos: (Seleccione un libro)")
             self._update_button_states()
             # Notifica al callback que no hay capítulo seleccionado
-            if self.on_chapter_selected_callback:
-                self.on_chapter_selected_callback(None)
+            self._notify_no_selection()
             return # Sale de la función
 
-        # Obtiene los detalles del libro para mostrar su título
-        book_details = self.app_handler.get_book_details(self.book_id)
-        # Extrae el título o usa "Desconocido" si no se encuentran detalles
-        book_title = book_details['title'] if book_details else "Desconocido"
-        # Actualiza la etiqueta para mostrar el título del libro (truncado si es largo)
-        self.list_label.SetLabel(f"Capítulos de: {book_title[:30]}{'...' if len(book_title)>30 else ''}")
-
-        # Obtiene los datos de los capítulos del manejador de la aplicación
-        self.chapters_data = self.app_handler.get_chapters_by_book_id(self.book_id)
-
-        # Si hay capítulos, los añade a la lista visual
-        if self.chapters_data:
-            for chapter in self.chapters_data:
-                # Formatea el texto a mostrar en la lista
-                display_text = f"Cap. {chapter['chapter_number']}: {chapter['title']}"
-                # Añade el texto a la lista, asociando el ID del capítulo como ClientData
-                self.chapter_list_ctrl.Append(display_text, chapter['id'])
+        # Obtiene la etiqueta del libro de la caché, consultando la BD solo la primera vez
+        book_label = self._book_label_cache.get(self.book_id)
+        if book_label is None:
+            book_details = self.app_handler.get_book_details(self.book_id)
+            # Extrae el título o usa "Desconocido" si no se encuentran detalles
+            book_title = book_details['title'] if book_details else "Desconocido"
+            # Formatea la etiqueta una sola vez (título truncado si es largo)
+            book_label = f"Capítulos de: {book_title[:30]}{'...' if len(book_title)>30 else ''}"
+            self._book_label_cache[self.book_id] = book_label
+        # Actualiza la etiqueta para mostrar el título del libro
+        self.list_label.SetLabel(book_label)
+
+        # Congela la lista durante la recarga para agrupar todos los repintados en uno
+        self.chapter_list_ctrl.Freeze()
+        try:
+            # Obtiene los datos de los capítulos del manejador de la aplicación
+            # y los convierte en filas ligeras con solo los campos que usa la lista
+            chapters = [ChapterRow(c['id'], c['chapter_number'], c['title'])
+                        for c in self.app_handler.get_chapters_by_book_id(self.book_id)]
+            # Ordena una sola vez por número de capítulo (la lista visual no se autoordena)
+            chapters.sort(key=lambda c: c.chapter_number)
+            self.chapters_data = chapters
+
+            # Reemplaza todo el contenido de la lista visual en una sola llamada
+            self.chapter_list_ctrl.Set([f"Cap. {c.chapter_number}: {c.title}" for c in chapters])
+            # Asocia el ID de cada capítulo como ClientData y registra su índice
+            for index, chapter in enumerate(chapters):
+                self.chapter_list_ctrl.SetClientData(index, chapter.id)
+                self._id_to_index[chapter.id] = index
+            # La lista está ordenada: el último capítulo tiene el número más alto
+            self._max_chapter_number = chapters[-1].chapter_number if chapters else 0
+        finally:
+            # Descongela la lista aunque falle la carga, provocando un único repintado
+            self.chapter_list_ctrl.Thaw()
 
         # Actualiza el estado de los botones basado en la nueva lista
         self._update_button_states()
 
         # Si no hay selección después de cargar (por ejemplo, si la lista estaba vacía),
         # notifica al callback que no hay capítulo seleccionado.
-        if self.chapter_list_ctrl.GetSelection() == wx.NOT_FOUND and self.on_chapter_selected_callback:
-            self.on_chapter_selected_callback(None)
+        if self.chapter_list_ctrl.GetSelection() == wx.NOT_FOUND:
+            self._notify_no_selection()
 
     def on_listbox_select(self, event: wx.CommandEvent):
         """
@@ -180,6 +292,20 @@ class ChapterListView(wx.Panel):
         Args:
             event (wx.CommandEvent): El evento de selección de ListBox.
         """
+        # Notifica la nueva selección y actualiza los botones
+        self._notify_selection_changed()
+        # Permite que el evento continúe su procesamiento estándar
+        event.Skip()
+
+    def _notify_selection_changed(self):
+        """
+        Notifica al callback el ID del capítulo actualmente seleccionado (o None)
+        y actualiza el estado de los botones.
+
+        Se usa tanto desde el manejador del evento de selección como tras una
+        selección programática, que así notifica directamente en lugar de
+        enviar un evento sintético a través del bucle de eventos.
+        """
         selected_chapter_id: Optional[int] = None
         # Obtiene el índice del elemento seleccionado
         selection_index = self.chapter_list_ctrl.GetSelection()
@@ -187,14 +313,34 @@ class ChapterListView(wx.Panel):
         if selection_index != wx.NOT_FOUND:
             selected_chapter_id = self.chapter_list_ctrl.GetClientData(selection_index)
 
-        # Si hay un callback registrado, lo ejecuta con el ID del capítulo seleccionado
-        if self.on_chapter_selected_callback:
-            self.on_chapter_selected_callback(selected_chapter_id)
+        # Ejecuta el callback con el ID del capítulo seleccionado
+        self._dispatch_chapter_selected(selected_chapter_id)
 
         # Actualiza el estado de los botones
         self._update_button_states()
-        # Permite que el evento continúe su procesamiento estándar
-        event.Skip()
+
+    def _dispatch_chapter_selected(self, chapter_id: Optional[int]):
+        """
+        Ejecuta el callback de selección (si hay uno registrado) y recuerda el
+        ID notificado.
+
+        Args:
+            chapter_id (Optional[int]): El ID del capítulo seleccionado, o None.
+        """
+        self._last_notified_chapter_id = chapter_id
+        self._has_notified = True
+        if self.on_chapter_selected_callback:
+            self.on_chapter_selected_callback(chapter_id)
+
+    def _notify_no_selection(self):
+        """
+        Notifica al callback que no hay capítulo seleccionado, salvo que eso
+        mismo ya fuera lo último notificado (evita repintados redundantes de
+        las vistas dependientes).
+        """
+        if self._has_notified and self._last_notified_chapter_id is None:
+            return
+        self._dispatch_chapter_selected(None)
 
     def on_listbox_dclick(self, event: wx.CommandEvent):
         """
@@ -230,11 +376,8 @@ class ChapterListView(wx.Panel):
                     wx.MessageBox("El título del capítulo no puede estar vacío.", "Error de Validación", wx.OK | wx.ICON_ERROR, self)
                     return # Sale si el título está vacío
 
-                # Calcula el número del siguiente capítulo. Si ya hay capítulos, es el máximo + 1.
-                next_chapter_number = 1
-                if self.chapters_data:
-                    # Encuentra el número de capítulo más alto existente y le suma 1
-                    next_chapter_number = max(c['chapter_number'] for c in self.chapters_data) + 1
+                # Calcula el número del siguiente capítulo a partir del máximo ya conocido
+                next_chapter_number = self._max_chapter_number + 1
 
                 # Llama al manejador de la aplicación para crear el nuevo capítulo en la base de datos
                 new_chapter_id = self.app_handler.create_new_chapter(self.book_id, next_chapter_number, title)
@@ -243,22 +386,14 @@ class ChapterListView(wx.Panel):
                 if new_chapter_id:
                     # Marca la aplicación como no modificada después de guardar el nuevo capítulo
                     self.app_handler.set_dirty(False)
-                    # Recarga la lista de capítulos para mostrar el nuevo
-                    self.load_chapters(self.book_id)
-
-                    # Busca el índice del nuevo capítulo en la lista visual por su ID
-                    new_idx = wx.NOT_FOUND
-                    for i in range(self.chapter_list_ctrl.GetCount()):
-                        if self.chapter_list_ctrl.GetClientData(i) == new_chapter_id:
-                            new_idx = i
-                            break # Sale del bucle una vez encontrado
-
-                    # Si se encontró el nuevo capítulo en la lista
-                    if new_idx != wx.NOT_FOUND:
-                        # Selecciona el nuevo capítulo en la lista
-                        self.chapter_list_ctrl.SetSelection(new_idx)
-                        # Envía un evento de selección para notificar a los oyentes (como el callback)
-                        wx.PostEvent(self.chapter_list_ctrl, wx.CommandEvent(wx.wxEVT_COMMAND_LISTBOX_SELECTED, self.chapter_list_ctrl.GetId()))
+                    # Añade el nuevo capítulo al final de la lista sin recargar todo desde la BD
+                    # (también actualiza el mapa de índices y el número de capítulo máximo)
+                    new_idx = self._append_chapter_row(ChapterRow(new_chapter_id, next_chapter_number, title))
+
+                    # Selecciona el nuevo capítulo en la lista
+                    self.chapter_list_ctrl.SetSelection(new_idx)
+                    # Notifica directamente la selección (SetSelection no emite eventos)
+                    self._notify_selection_changed()
 
                     # REQ-Jefe-004: Eliminado wx.MessageBox de confirmación
 
@@ -298,8 +433,8 @@ class ChapterListView(wx.Panel):
                 if success:
                     # Marca la aplicación como no modificada después de guardar los cambios
                     self.app_handler.set_dirty(False)
-                    # Recarga la lista de capítulos para reflejar la eliminación
-                    self.load_chapters(self.book_id)
+                    # Quita solo la fila eliminada en lugar de recargar toda la lista desde la BD
+                    self._remove_chapter_row(selected_index, chapter_id_to_delete)
                     # REQ-Jefe-004: Eliminado wx.MessageBox de confirmación
 
     def get_selected_chapter_id(self) -> Optional[int]:
@@ -331,33 +466,33 @@ class ChapterListView(wx.Panel):
             # Si hay algo seleccionado, lo deselecciona
             if current_selection != wx.NOT_FOUND:
                 self.chapter_list_ctrl.SetSelection(wx.NOT_FOUND)
-                # Envía un evento de selección (con None) para notificar a los oyentes
-                wx.PostEvent(self.chapter_list_ctrl, wx.CommandEvent(wx.wxEVT_COMMAND_LISTBOX_SELECTED, self.chapter_list_ctrl.GetId()))
-            # Actualiza el estado de los botones
-            self._update_button_states()
+                # Notifica directamente la deselección (también actualiza los botones)
+                self._notify_selection_changed()
+            else:
+                # Actualiza el estado de los botones
+                self._update_button_states()
             return # Sale de la función
 
-        # Si se pide seleccionar un capítulo por ID
-        # Itera sobre todos los elementos de la lista
-        for i in range(self.chapter_list_ctrl.GetCount()):
-            # Compara el ClientData (ID del capítulo) del elemento actual con el ID buscado
-            if self.chapter_list_ctrl.GetClientData(i) == chapter_id:
-                # Si el elemento encontrado no es el que ya está seleccionado
-                if self.chapter_list_ctrl.GetSelection() != i:
-                    # Establece la selección en el índice encontrado
-                    self.chapter_list_ctrl.SetSelection(i)
-                    # Envía un evento de selección para notificar a los oyentes
-                    wx.PostEvent(self.chapter_list_ctrl, wx.CommandEvent(wx.wxEVT_COMMAND_LISTBOX_SELECTED, self.chapter_list_ctrl.GetId()))
-                else:
-                    # Si ya estaba seleccionado, simplemente actualiza el estado de los botones
-                    self._update_button_states()
-                return # Sale de la función una vez que el capítulo es encontrado y seleccionado
-
-        # Si el bucle termina y el capítulo con el ID dado no fue encontrado en la lista actual
+        # Si se pide seleccionar un capítulo por ID, busca su índice en el mapa
+        i = self._id_to_index.get(chapter_id, wx.NOT_FOUND)
+        if i != wx.NOT_FOUND:
+            # Si el elemento encontrado no es el que ya está seleccionado
+            if self.chapter_list_ctrl.GetSelection() != i:
+                # Establece la selección en el índice encontrado
+                self.chapter_list_ctrl.SetSelection(i)
+                # Notifica directamente la selección (también actualiza los botones)
+                self._notify_selection_changed()
+            else:
+                # Si ya estaba seleccionado, simplemente actualiza el estado de los botones
+                self._update_button_states()
+            return # Sale de la función una vez que el capítulo es encontrado y seleccionado
+
+        # Si el capítulo con el ID dado no fue encontrado en la lista actual
         # Deselecciona cualquier capítulo que pudiera estar seleccionado previamente
         if self.chapter_list_ctrl.GetSelection() != wx.NOT_FOUND:
             self.chapter_list_ctrl.SetSelection(wx.NOT_FOUND)
-            # Envía un evento de selección (con None) para notificar a los oyentes
-            wx.PostEvent(self.chapter_list_ctrl, wx.CommandEvent(wx.wxEVT_COMMAND_LISTBOX_SELECTED, self.chapter_list_ctrl.GetId()))
-        # Actualiza el estado de los botones
-        self._update_button_states()
\ No newline at end of file
+            # Notifica directamente la deselección (también actualiza los botones)
+            self._notify_selection_changed()
+        else:
+            # Actualiza el estado de los botones
+            self._update_button_states()
\ No newline at end of file
@@ -7,8 +7,98 @@ Date: 07/06/2025
 Version: 0.0.1
 License: MIT License
 """
+import contextlib
 import wx
-from typing import List, Dict, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
+
+# Retardo (en milisegundos) para agrupar ráfagas de cambios de selección en la lista
+_SELECTION_DEBOUNCE_MS: int = 30
+
+# Mensajes, títulos y estilos de los cuadros de diálogo
+_MSG_ADD_FAIL: str = "No se pudo agregar la idea."
+_MSG_EDIT_FAIL: str = "No se pudo editar la idea."
+_MSG_DELETE_FAIL: str = "No se pudo eliminar la idea."
+_MSG_SELECT_TO_EDIT: str = "Seleccione una idea para editar."
+_MSG_SELECT_TO_DELETE: str = "Seleccione una idea para eliminar."
+_MSG_ADD_EMPTY: str = "La idea no puede estar vacía."
+_MSG_EDIT_EMPTY: str = "La idea no puede quedar vacía."
+_DEL_MSG_TMPL: str = "¿Eliminar la idea concreta:\n\n'%s'?"
+_TITLE_ERROR: str = "Error"
+_TITLE_INFO: str = "Info"
+_TITLE_CONFIRM_DELETE: str = "Confirmar Eliminación"
+_STYLE_ERROR: int = wx.OK | wx.ICON_ERROR
+_STYLE_INFO: int = wx.OK | wx.ICON_INFORMATION
+_STYLE_CONFIRM_DELETE: int = wx.YES_NO | wx.NO_DEFAULT | wx.ICON_WARNING
+
+@contextlib.contextmanager
+def _frozen(ctrl: wx.Window) -> Iterator[None]:
+    """
+    Congela un control durante un bloque de modificaciones masivas para que
+    se repinte una sola vez al terminar, aunque el bloque falle.
+
+    Args:
+        ctrl (wx.Window): El control a congelar.
+    """
+    ctrl.Freeze()
+    try:
+        yield
+    finally:
+        ctrl.Thaw()
+
+class _VirtualIdeaList(wx.ListCtrl):
+    """
+    Lista virtual de una sola columna para las ideas concretas.
+
+    No almacena los textos en el control nativo: los pide bajo demanda
+    (solo para las filas visibles) a través de `text_getter`, por lo que
+    recargar o modificar la lista solo requiere ajustar el número de
+    elementos y refrescar las filas afectadas.
+    """
+    def __init__(self, parent: wx.Window, text_getter: Callable[[int], str]):
+        """
+        Inicializa la lista virtual.
+
+        Args:
+            parent (wx.Window): La ventana padre de la lista.
+            text_getter (Callable[[int], str]): Función que devuelve el texto
+                                                de la fila con el índice dado.
+        """
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL | wx.LC_NO_HEADER)
+        self._text_getter = text_getter
+        self.InsertColumn(0, "")
+        # La única columna ocupa siempre todo el ancho disponible
+        self.Bind(wx.EVT_SIZE, self.on_size)
+
+    def OnGetItemText(self, item: int, col: int) -> str:
+        """
+        Devuelve el texto de una fila cuando el control necesita pintarla.
+
+        Args:
+            item (int): El índice de la fila.
+            col (int): El índice de la columna (siempre 0).
+
+        Returns:
+            str: El texto de la idea en esa fila.
+        """
+        return self._text_getter(item)
+
+    def on_size(self, event: wx.SizeEvent):
+        """
+        Ajusta el ancho de la columna al ancho del área cliente.
+
+        Args:
+            event (wx.SizeEvent): El evento de cambio de tamaño.
+        """
+        self.SetColumnWidth(0, self.GetClientSize().GetWidth())
+        event.Skip()
+
+    def clear_selection(self):
+        """
+        Deselecciona cualquier fila seleccionada.
+        """
+        selected_index = self.GetFirstSelected()
+        if selected_index != wx.NOT_FOUND:
+            self.SetItemState(selected_index, 0, wx.LIST_STATE_SELECTED)
 
 class ConcreteIdeaView(wx.Panel):
     """
@@ -29,7 +119,20 @@ class ConcreteIdeaView(wx.Panel):
         super().__init__(parent)
         self.app_handler = app_handler # Referencia al manejador de la aplicación
         self.chapter_id: Optional[int] = None # ID del capítulo actualmente seleccionado
-        self.ideas_data: List[Dict[str, Any]] = [] # Lista de diccionarios con los datos de las ideas (id, idea)
+        # Datos de las ideas en listas paralelas (misma posición = misma idea que en la lista visual)
+        self._idea_ids: List[int] = [] # IDs de las ideas
+        self._idea_texts: List[str] = [] # Textos de las ideas
+        self._id_to_index: Dict[int, int] = {} # Mapa ID de idea -> posición en las listas, para búsquedas O(1)
+        # Último estado de habilitación aplicado (Agregar, Editar, Eliminar, Lista), para no repetir llamadas
+        self._last_enable_state: Optional[Tuple[bool, bool, bool, bool]] = None
+        # Diálogos de agregar/editar, creados la primera vez que se usan y reutilizados después
+        self._add_dlg: Optional[wx.TextEntryDialog] = None
+        self._edit_dlg: Optional[wx.TextEntryDialog] = None
+        self._layout_pending: bool = False # Indica si ya hay un Layout() programado con CallAfter
+        self._last_selection: int = wx.NOT_FOUND # Índice seleccionado usado en la última actualización de botones
+        self._view_enabled: bool = True # Último valor recibido en enable_view (bloqueo lógico de la vista)
+        self._btn_state_timer: Optional[wx.CallLater] = None # Actualización de botones pendiente tras cambios de selección
+        self._load_generation: int = 0 # Número de la última carga de ideas programada (descarta cargas obsoletas)
 
         self._create_controls() # Crea los widgets de la interfaz
         self._layout_controls() # Organiza los widgets en el panel
@@ -42,7 +145,7 @@ class ConcreteIdeaView(wx.Panel):
         Crea los controles (widgets) que componen la interfaz de usuario del panel.
         """
         self.info_label = wx.StaticText(self, label="Ideas Concretas del Capítulo:") # Etiqueta informativa
-        self.concrete_idea_list_ctrl = wx.ListBox(self, style=wx.LB_SINGLE) # Lista para mostrar las ideas
+        self.concrete_idea_list_ctrl = _VirtualIdeaList(self, self._get_idea_text) # Lista virtual para mostrar las ideas
         self.button_panel = wx.Panel(self) # Panel contenedor para los botones
 
         # Botones de acción
@@ -56,8 +159,78 @@ class ConcreteIdeaView(wx.Panel):
         self.delete_button.Bind(wx.EVT_BUTTON, self.on_delete_button_click)
 
         # Enlazar eventos de la lista
-        self.concrete_idea_list_ctrl.Bind(wx.EVT_LISTBOX_DCLICK, self.on_edit_button_click) # Doble click edita
-        self.concrete_idea_list_ctrl.Bind(wx.EVT_LISTBOX, self.on_list_selection_changed) # Selección cambia estado de botones
+        self.concrete_idea_list_ctrl.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_edit_button_click) # Doble click (o Intro) edita
+        self.concrete_idea_list_ctrl.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_list_selection_changed) # Selección cambia estado de botones
+        self.concrete_idea_list_ctrl.Bind(wx.EVT_LIST_ITEM_DESELECTED, self.on_list_selection_changed)
+
+        # Libera los diálogos reutilizables al destruir el panel
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_window_destroy)
+
+    def _get_add_dialog(self) -> wx.TextEntryDialog:
+        """
+        Devuelve el diálogo para agregar ideas, creándolo la primera vez.
+
+        Returns:
+            wx.TextEntryDialog: El diálogo de entrada para nuevas ideas.
+        """
+        if self._add_dlg is None:
+            self._add_dlg = wx.TextEntryDialog(self, "Nueva idea concreta:", "Agregar Idea")
+            # Impide aceptar el diálogo con el campo vacío sin cerrarlo
+            self._add_dlg.SetTextValidator(wx.FILTER_EMPTY)
+        return self._add_dlg
+
+    def _get_edit_dialog(self) -> wx.TextEntryDialog:
+        """
+        Devuelve el diálogo para editar ideas, creándolo la primera vez.
+
+        Returns:
+            wx.TextEntryDialog: El diálogo de entrada para editar ideas.
+        """
+        if self._edit_dlg is None:
+            self._edit_dlg = wx.TextEntryDialog(self, "Editar idea concreta:", "Editar Idea")
+            # Impide aceptar el diálogo con el campo vacío sin cerrarlo
+            self._edit_dlg.SetTextValidator(wx.FILTER_EMPTY)
+        return self._edit_dlg
+
+    def on_window_destroy(self, event: wx.WindowDestroyEvent):
+        """
+        Destruye los diálogos reutilizables cuando se destruye el panel.
+
+        Args:
+            event (wx.WindowDestroyEvent): El evento de destrucción de ventana.
+        """
+        if event.GetEventObject() is self:
+            # Cancela una actualización de botones pendiente sobre controles que van a desaparecer
+            if self._btn_state_timer is not None:
+                self._btn_state_timer.Stop()
+                self._btn_state_timer = None
+            for dlg in (self._add_dlg, self._edit_dlg):
+                if dlg:
+                    dlg.Destroy()
+            self._add_dlg = None
+            self._edit_dlg = None
+        event.Skip()
+
+    def _get_idea_text(self, index: int) -> str:
+        """
+        Devuelve el texto de la idea en la posición dada, para la lista virtual.
+
+        Args:
+            index (int): El índice de la idea.
+
+        Returns:
+            str: El texto de la idea, o una cadena vacía si el índice no es válido.
+        """
+        return self._idea_texts[index] if 0 <= index < len(self._idea_texts) else ""
+
+    def _get_selected_index(self) -> int:
+        """
+        Devuelve el índice de la idea seleccionada en la lista.
+
+        Returns:
+            int: El índice seleccionado, o wx.NOT_FOUND si no hay selección.
+        """
+        return self.concrete_idea_list_ctrl.GetFirstSelected()
 
     def _layout_controls(self):
         """
@@ -89,9 +262,7 @@ class ConcreteIdeaView(wx.Panel):
 
         # Establecer el sizer principal para el panel
         self.SetSizer(main_sizer)
-
-        # Actualizar el estado inicial de los botones
-        self._update_button_states()
+        # El estado inicial de los botones lo establece load_ideas(None) al final de __init__
 
     def _update_button_states(self):
         """
@@ -99,17 +270,37 @@ class ConcreteIdeaView(wx.Panel):
         basándose en si hay un capítulo seleccionado, si hay un elemento
         seleccionado en la lista y si la vista general está habilitada.
         """
-        view_enabled = self.IsEnabled() # Verifica si el panel ConcreteIdeaView está habilitado globalmente
+        # Verifica si el panel está habilitado globalmente y no bloqueado mediante enable_view
+        view_enabled = self._view_enabled and self.IsEnabled()
         has_chapter = self.chapter_id is not None # Verifica si hay un capítulo cargado
-        selection_index = self.concrete_idea_list_ctrl.GetSelection() # Obtiene el índice seleccionado
+        selection_index = self._get_selected_index() # Obtiene el índice seleccionado
+        self._last_selection = selection_index # Recuerda la selección con la que se evalúan los botones
         has_selection = selection_index != wx.NOT_FOUND # Verifica si hay algún elemento seleccionado
 
-        # Habilitar/deshabilitar botones según las condiciones
-        self.add_button.Enable(view_enabled and has_chapter)
-        self.edit_button.Enable(view_enabled and has_chapter and has_selection)
-        self.delete_button.Enable(view_enabled and has_chapter and has_selection)
-        # La lista también se deshabilita si no hay capítulo o la vista no está habilitada
-        self.concrete_idea_list_ctrl.Enable(view_enabled and has_chapter)
+        can_add = view_enabled and has_chapter
+        can_modify = can_add and has_selection
+
+        # Habilitar/deshabilitar botones según las condiciones; la lista también se
+        # deshabilita si no hay capítulo o la vista no está habilitada
+        self._apply_enable_state((can_add, can_modify, can_modify, can_add))
+
+    def _apply_enable_state(self, state: Tuple[bool, bool, bool, bool]):
+        """
+        Aplica el estado de habilitación a los botones y a la lista, llamando a
+        `Enable` solo en los controles cuyo estado cambió desde la última vez.
+
+        Args:
+            state (Tuple[bool, bool, bool, bool]): Estados para Agregar, Editar,
+                                                   Eliminar y la lista, en ese orden.
+        """
+        last_state = self._last_enable_state
+        if state == last_state:
+            return
+        controls = (self.add_button, self.edit_button, self.delete_button, self.concrete_idea_list_ctrl)
+        for i, control in enumerate(controls):
+            if last_state is None or last_state[i] != state[i]:
+                control.Enable(state[i])
+        self._last_enable_state = state
 
 
     def on_list_selection_changed(self, event: wx.Event):
@@ -117,82 +308,192 @@ class ConcreteIdeaView(wx.Panel):
         Manejador de evento para cuando cambia la selección en la lista de ideas.
         Actualiza el estado de los botones.
 
+        El evento no se propaga a las ventanas padre (no se llama a `event.Skip()`):
+        ninguna lo escucha. Si alguna llegara a necesitarlo, debe enlazar su propio
+        manejador en la lista en lugar de depender de la propagación.
+
         Args:
             event (wx.Event): El evento de cambio de selección.
         """
-        self._update_button_states() # Re-evalúa el estado de los botones
-        event.Skip() # Permite que el evento se propague si es necesario
+        # Si la selección es la misma con la que se evaluaron los botones, no hay nada que actualizar
+        if self._get_selected_index() != self._last_selection:
+            # Agrupa las ráfagas (ej. recorrer la lista con las flechas) en una sola
+            # re-evaluación de los botones con la selección final
+            if self._btn_state_timer is not None and self._btn_state_timer.IsRunning():
+                self._btn_state_timer.Restart(_SELECTION_DEBOUNCE_MS)
+            else:
+                self._btn_state_timer = wx.CallLater(_SELECTION_DEBOUNCE_MS, self._update_button_states)
 
     def load_ideas(self, chapter_id: Optional[int]):
         """
         Carga las ideas concretas para un capítulo dado.
 
-        Limpia la lista actual, actualiza la etiqueta informativa y carga
-        las ideas desde el manejador de la aplicación si se proporciona un chapter_id.
+        Actualiza la etiqueta informativa y, si se proporciona un chapter_id,
+        programa la consulta de sus ideas al manejador de la aplicación para el
+        próximo ciclo del bucle de eventos, de modo que el cambio de capítulo se
+        pinte antes y varias recargas seguidas se resuelvan con una sola consulta.
 
         Args:
             chapter_id (Optional[int]): El ID del capítulo cuyas ideas se cargarán,
                                         o None para limpiar la vista.
         """
+        same_chapter = chapter_id == self.chapter_id # Indica si se recarga el mismo capítulo
         self.chapter_id = chapter_id # Almacena el ID del capítulo actual
-        self.concrete_idea_list_ctrl.Clear() # Limpia la lista visual
-        self.ideas_data.clear() # Limpia los datos internos
+        # Invalida cualquier carga programada anteriormente
+        self._load_generation += 1
 
         is_chapter_present = self.chapter_id is not None # Bandera para saber si hay capítulo
 
-        # Actualiza la etiqueta informativa
-        self.info_label.SetLabel("Ideas Concretas:" if is_chapter_present else "Ideas Concretas: (Seleccione un capítulo)")
+        # Actualiza la etiqueta informativa; solo su cambio de texto afecta al layout
+        # (el contenido de la lista no cambia la geometría de los sizers)
+        new_label = "Ideas Concretas:" if is_chapter_present else "Ideas Concretas: (Seleccione un capítulo)"
+        if self.info_label.GetLabel() != new_label:
+            self.info_label.SetLabel(new_label)
+            self._schedule_layout()
+
+        # Si cambia el capítulo, no deja visibles (ni editables) las ideas del anterior
+        if not same_chapter:
+            self._show_ideas([], [])
 
-        # Si hay un capítulo, carga las ideas
         if is_chapter_present:
-            raw_ideas = self.app_handler.get_concrete_ideas_for_chapter(self.chapter_id) # Obtiene ideas del manejador
-            if raw_ideas:
-                # Añade cada idea a los datos internos y a la lista visual
-                for idea_dict in raw_ideas:
-                    self.ideas_data.append({'id': idea_dict['id'], 'idea': idea_dict['idea']})
-                    self.concrete_idea_list_ctrl.Append(idea_dict['idea'])
-
-        # Actualiza el estado de los botones y redibuja el layout
+            # Consulta las ideas en el próximo ciclo; solo la última carga programada se ejecuta
+            wx.CallAfter(self._finish_load_ideas, self._load_generation)
+        else:
+            # Actualiza el estado de los botones
+            self._update_button_states()
+
+    def _finish_load_ideas(self, generation: int):
+        """
+        Obtiene del manejador las ideas del capítulo actual y las muestra,
+        salvo que la carga haya quedado obsoleta o el panel ya no exista.
+
+        Args:
+            generation (int): El número de carga con el que se programó la consulta.
+        """
+        if not self or generation != self._load_generation or self.chapter_id is None:
+            return
+
+        # Obtiene las ideas del capítulo del manejador
+        raw_ideas = self.app_handler.get_concrete_ideas_for_chapter(self.chapter_id) or []
+        # Construye los nuevos datos de una sola pasada
+        self._show_ideas([d['id'] for d in raw_ideas], [d['idea'] for d in raw_ideas])
+
+        # Actualiza el estado de los botones
         self._update_button_states()
-        self.Layout()
+
+    def _show_ideas(self, new_ids: List[int], new_texts: List[str]):
+        """
+        Sustituye los datos internos y actualiza la lista virtual, tocando el
+        control lo mínimo posible.
+
+        Args:
+            new_ids (List[int]): Los IDs de las ideas, en orden.
+            new_texts (List[str]): Los textos de las ideas, en el mismo orden.
+        """
+        if new_ids == self._idea_ids:
+            # Mismas ideas: conserva la selección y solo repinta las filas
+            # cuyo texto cambió (ninguna en el caso habitual)
+            changed_rows = [i for i, (old_text, new_text) in enumerate(zip(self._idea_texts, new_texts)) if old_text != new_text]
+            self._idea_texts = new_texts
+            for row in changed_rows:
+                self.concrete_idea_list_ctrl.RefreshItem(row)
+            return
+
+        self._idea_ids = new_ids
+        self._idea_texts = new_texts
+        self._id_to_index = {idea_id: index for index, idea_id in enumerate(new_ids)}
+
+        # La lista virtual solo necesita conocer el nuevo número de elementos;
+        # los textos se piden bajo demanda para las filas visibles
+        with _frozen(self.concrete_idea_list_ctrl):
+            self.concrete_idea_list_ctrl.clear_selection()
+            self.concrete_idea_list_ctrl.SetItemCount(len(new_ids))
+            self.concrete_idea_list_ctrl.Refresh()
+
+    def _schedule_layout(self):
+        """
+        Programa un único `Layout()` para el próximo ciclo del bucle de eventos,
+        agrupando varias solicitudes seguidas en una sola pasada de los sizers.
+        """
+        if not self._layout_pending:
+            self._layout_pending = True
+            wx.CallAfter(self._maybe_layout)
+
+    def _maybe_layout(self):
+        """
+        Ejecuta el `Layout()` pendiente, si lo hay.
+        """
+        if self._layout_pending:
+            self._layout_pending = False
+            self.Layout()
 
     def _add_idea_to_list(self, idea_id: int, idea_text: str):
         """
-        Añade una nueva idea a los datos internos y a la lista visual.
+        Añade una nueva idea a los datos internos y a la lista visual, y marca
+        los datos como modificados.
 
         Args:
             idea_id (int): El ID de la nueva idea.
             idea_text (str): El texto de la nueva idea.
         """
-        self.ideas_data.append({'id': idea_id, 'idea': idea_text}) # Añade a los datos internos
-        self.concrete_idea_list_ctrl.Append(idea_text) # Añade a la lista visual
+        self._add_ideas_to_list([(idea_id, idea_text)])
+
+    def _add_ideas_to_list(self, pairs: List[Tuple[int, str]]):
+        """
+        Añade varias ideas de una vez a los datos internos y a la lista visual,
+        con una sola actualización del control, de los botones y del estado
+        'dirty'. Cualquier alta masiva (pegar, importar) debe pasar por aquí.
+
+        Args:
+            pairs (List[Tuple[int, str]]): Pares (ID, texto) de las nuevas ideas.
+        """
+        if not pairs:
+            return
+        # Añade a los datos internos
+        first_index = len(self._idea_ids)
+        self._idea_ids.extend(idea_id for idea_id, _ in pairs)
+        self._idea_texts.extend(idea_text for _, idea_text in pairs)
+        for offset, (idea_id, _) in enumerate(pairs):
+            self._id_to_index[idea_id] = first_index + offset
+        self.concrete_idea_list_ctrl.SetItemCount(len(self._idea_ids)) # Añade las filas a la lista visual
         self._update_button_states() # Actualiza el estado de los botones
+        self.app_handler.set_dirty(True) # Indica que los datos han cambiado
 
-    def _edit_idea_in_list(self, index: int, new_idea_text: str):
+    def _edit_idea_in_list(self, idea_id: int, new_idea_text: str):
         """
-        Edita una idea existente en los datos internos y en la lista visual por índice.
+        Edita una idea existente en los datos internos y en la lista visual por su ID.
 
         Args:
-            index (int): El índice de la idea a editar.
+            idea_id (int): El ID de la idea a editar.
             new_idea_text (str): El nuevo texto para la idea.
         """
-        # Verifica que el índice sea válido
-        if 0 <= index < len(self.ideas_data):
-            self.ideas_data[index]['idea'] = new_idea_text # Actualiza en los datos internos
-            self.concrete_idea_list_ctrl.SetString(index, new_idea_text) # Actualiza en la lista visual
+        # Busca la posición de la idea en el mapa
+        index = self._id_to_index.get(idea_id)
+        if index is not None:
+            self._idea_texts[index] = new_idea_text # Actualiza en los datos internos
+            self.concrete_idea_list_ctrl.RefreshItem(index) # Repinta solo la fila editada
             self._update_button_states() # Actualiza el estado de los botones
 
-    def _delete_idea_from_list(self, index: int):
+    def _delete_idea_from_list(self, idea_id: int):
         """
-        Elimina una idea de los datos internos y de la lista visual por índice.
+        Elimina una idea de los datos internos y de la lista visual por su ID.
 
         Args:
-            index (int): El índice de la idea a eliminar.
+            idea_id (int): El ID de la idea a eliminar.
         """
-        # Verifica que el índice sea válido
-        if 0 <= index < len(self.ideas_data):
-            del self.ideas_data[index] # Elimina de los datos internos
-            self.concrete_idea_list_ctrl.Delete(index) # Elimina de la lista visual
+        # Busca (y retira) la posición de la idea en el mapa
+        index = self._id_to_index.pop(idea_id, None)
+        if index is not None:
+            # Elimina de los datos internos
+            del self._idea_ids[index]
+            del self._idea_texts[index]
+            # Las ideas posteriores a la eliminada retroceden una posición
+            for later_index in range(index, len(self._idea_ids)):
+                self._id_to_index[self._idea_ids[later_index]] = later_index
+            # Deselecciona la fila eliminada (la selección de la lista virtual es por índice)
+            self.concrete_idea_list_ctrl.clear_selection()
+            self.concrete_idea_list_ctrl.SetItemCount(len(self._idea_ids)) # Ajusta el número de filas
+            self.concrete_idea_list_ctrl.Refresh() # Repinta las filas desplazadas
             self._update_button_states() # Actualiza el estado de los botones
 
     def on_add_button_click(self, event: wx.Event):
@@ -207,25 +508,26 @@ class ConcreteIdeaView(wx.Panel):
         if self.chapter_id is None or not self.IsEnabled():
             return
 
-        # Abre un diálogo de entrada de texto
-        with wx.TextEntryDialog(self, "Nueva idea concreta:", "Agregar Idea") as dlg:
-            if dlg.ShowModal() == wx.ID_OK: # Si el usuario presiona OK
-                new_idea_text = dlg.GetValue().strip() # Obtiene el texto y elimina espacios
-
-                if new_idea_text: # Si el texto no está vacío
-                    # Intenta añadir la idea a través del manejador de la aplicación
-                    idea_id = self.app_handler.add_concrete_idea_for_chapter(self.chapter_id, new_idea_text)
-                    if idea_id:
-                        # Si se añadió con éxito, actualiza la lista visual y marca como sucio
-                        self._add_idea_to_list(idea_id, new_idea_text)
-                        self.app_handler.set_dirty(True) # Indica que los datos han cambiado
-                        wx.Bell() # Emite un sonido para notificar
-                    else:
-                        # Muestra un mensaje de error si no se pudo añadir
-                        wx.MessageBox(f"No se pudo agregar la idea.", "Error", wx.OK | wx.ICON_ERROR, self)
+        # Abre el diálogo de entrada de texto (reutilizado entre usos)
+        dlg = self._get_add_dialog()
+        dlg.SetValue("") # Parte de un campo vacío en cada uso
+        if dlg.ShowModal() == wx.ID_OK: # Si el usuario presiona OK
+            new_idea_text = dlg.GetValue().strip() # Obtiene el texto y elimina espacios
+
+            # El validador impide el campo vacío, pero no un texto solo de espacios
+            if new_idea_text:
+                # Intenta añadir la idea a través del manejador de la aplicación
+                idea_id = self.app_handler.add_concrete_idea_for_chapter(self.chapter_id, new_idea_text)
+                if idea_id:
+                    # Si se añadió con éxito, actualiza la lista visual y marca como sucio
+                    self._add_idea_to_list(idea_id, new_idea_text)
+                    wx.Bell() # Emite un sonido para notificar
                 else:
-                    # Muestra un mensaje si el texto está vacío
-                    wx.MessageBox("La idea no puede estar vacía.", "Info", wx.OK | wx.ICON_INFORMATION, self)
+                    # Muestra un mensaje de error si no se pudo añadir
+                    wx.MessageBox(_MSG_ADD_FAIL, _TITLE_ERROR, _STYLE_ERROR, self)
+            else:
+                # Muestra un mensaje si el texto está vacío
+                wx.MessageBox(_MSG_ADD_EMPTY, _TITLE_INFO, _STYLE_INFO, self)
 
     def on_edit_button_click(self, event: wx.Event):
         """
@@ -239,37 +541,38 @@ class ConcreteIdeaView(wx.Panel):
         if self.chapter_id is None or not self.IsEnabled():
             return
 
-        selected_index = self.concrete_idea_list_ctrl.GetSelection() # Obtiene el índice seleccionado
+        selected_index = self._get_selected_index() # Obtiene el índice seleccionado
 
         # Verifica si hay un elemento seleccionado
         if selected_index == wx.NOT_FOUND:
-            wx.MessageBox("Seleccione una idea para editar.", "Info", wx.OK | wx.ICON_INFORMATION, self)
+            wx.MessageBox(_MSG_SELECT_TO_EDIT, _TITLE_INFO, _STYLE_INFO, self)
             return
 
         # Obtiene los datos de la idea seleccionada
-        idea_to_edit_dict = self.ideas_data[selected_index]
-        current_idea_text = idea_to_edit_dict['idea']
-        idea_id_to_edit = idea_to_edit_dict['id']
-
-        # Abre un diálogo de entrada de texto con el valor actual
-        with wx.TextEntryDialog(self, "Editar idea concreta:", "Editar Idea", current_idea_text) as dlg:
-            if dlg.ShowModal() == wx.ID_OK: # Si el usuario presiona OK
-                updated_idea_text = dlg.GetValue().strip() # Obtiene el nuevo texto
-
-                # Verifica si el texto ha cambiado y no está vacío
-                if updated_idea_text and updated_idea_text != current_idea_text:
-                    # Intenta actualizar la idea a través del manejador
-                    success = self.app_handler.update_concrete_idea_text(idea_id_to_edit, updated_idea_text)
-                    if success:
-                        # Si se actualizó con éxito, actualiza la lista visual y marca como sucio
-                        self._edit_idea_in_list(selected_index, updated_idea_text)
-                        self.app_handler.set_dirty(True) # Indica que los datos han cambiado
-                    else:
-                        # Muestra un mensaje de error si no se pudo editar
-                        wx.MessageBox(f"No se pudo editar la idea.", "Error", wx.OK | wx.ICON_ERROR, self)
-                elif not updated_idea_text:
-                    # Muestra un mensaje si el texto queda vacío
-                    wx.MessageBox("La idea no puede quedar vacía.", "Info", wx.OK | wx.ICON_INFORMATION, self)
+        current_idea_text = self._idea_texts[selected_index]
+        idea_id_to_edit = self._idea_ids[selected_index]
+
+        # Abre el diálogo de edición (reutilizado entre usos) con el valor actual
+        dlg = self._get_edit_dialog()
+        dlg.SetValue(current_idea_text) # Precarga el texto actual
+        if dlg.ShowModal() == wx.ID_OK: # Si el usuario presiona OK
+            updated_idea_text = dlg.GetValue().strip() # Obtiene el nuevo texto
+
+            # Verifica si el texto ha cambiado y no está vacío (el validador impide
+            # el campo vacío, pero no un texto solo de espacios)
+            if updated_idea_text and updated_idea_text != current_idea_text:
+                # Intenta actualizar la idea a través del manejador
+                success = self.app_handler.update_concrete_idea_text(idea_id_to_edit, updated_idea_text)
+                if success:
+                    # Si se actualizó con éxito, actualiza la lista visual y marca como sucio
+                    self._edit_idea_in_list(idea_id_to_edit, updated_idea_text)
+                    self.app_handler.set_dirty(True) # Indica que los datos han cambiado
+                else:
+                    # Muestra un mensaje de error si no se pudo editar
+                    wx.MessageBox(_MSG_EDIT_FAIL, _TITLE_ERROR, _STYLE_ERROR, self)
+            elif not updated_idea_text:
+                # Muestra un mensaje si el texto queda vacío
+                wx.MessageBox(_MSG_EDIT_EMPTY, _TITLE_INFO, _STYLE_INFO, self)
 
     def on_delete_button_click(self, event: wx.Event):
         """
@@ -283,33 +586,32 @@ class ConcreteIdeaView(wx.Panel):
         if self.chapter_id is None or not self.IsEnabled():
             return
 
-        selected_index = self.concrete_idea_list_ctrl.GetSelection() # Obtiene el índice seleccionado
+        selected_index = self._get_selected_index() # Obtiene el índice seleccionado
 
         # Verifica si hay un elemento seleccionado
         if selected_index == wx.NOT_FOUND:
-            wx.MessageBox("Seleccione una idea para eliminar.", "Info", wx.OK | wx.ICON_INFORMATION, self)
+            wx.MessageBox(_MSG_SELECT_TO_DELETE, _TITLE_INFO, _STYLE_INFO, self)
             return
 
         # Obtiene los datos de la idea seleccionada
-        idea_to_delete_dict = self.ideas_data[selected_index]
-        idea_id_to_delete = idea_to_delete_dict['id']
-        idea_text_to_delete = idea_to_delete_dict['idea']
+        idea_id_to_delete = self._idea_ids[selected_index]
+        idea_text_to_delete = self._idea_texts[selected_index]
 
         # Prepara el mensaje de confirmación
-        msg = f"¿Eliminar la idea concreta:\n\n'{idea_text_to_delete}'?"
+        msg = _DEL_MSG_TMPL % idea_text_to_delete
 
         # Abre un diálogo de confirmación
-        with wx.MessageDialog(self, msg, "Confirmar Eliminación", wx.YES_NO | wx.NO_DEFAULT | wx.ICON_WARNING) as dlg:
+        with wx.MessageDialog(self, msg, _TITLE_CONFIRM_DELETE, _STYLE_CONFIRM_DELETE) as dlg:
             if dlg.ShowModal() == wx.ID_YES: # Si el usuario confirma
                 # Intenta eliminar la idea a través del manejador
                 success = self.app_handler.delete_concrete_idea_by_id(idea_id_to_delete)
                 if success:
                     # Si se eliminó con éxito, actualiza la lista visual y marca como sucio
-                    self._delete_idea_from_list(selected_index)
+                    self._delete_idea_from_list(idea_id_to_delete)
                     self.app_handler.set_dirty(True) # Indica que los datos han cambiado
                 else:
                     # Muestra un mensaje de error si no se pudo eliminar
-                    wx.MessageBox(f"No se pudo eliminar la idea.", "Error", wx.OK | wx.ICON_ERROR, self)
+                    wx.MessageBox(_MSG_DELETE_FAIL, _TITLE_ERROR, _STYLE_ERROR, self)
 
     def enable_view(self, enable: bool):
         """
@@ -320,16 +622,16 @@ class ConcreteIdeaView(wx.Panel):
         Args:
             enable (bool): True para habilitar la vista, False para deshabilitarla.
         """
-        # La lista se habilita solo si la vista se habilita Y hay un capítulo seleccionado
-        self.concrete_idea_list_ctrl.Enable(enable and self.chapter_id is not None)
+        # Si el estado solicitado ya es el actual, no hay nada que hacer
+        if enable == self._view_enabled:
+            return
+        self._view_enabled = enable
 
-        # Los botones se actualizan a través de _update_button_states, que ya considera self.IsEnabled().
-        # Sin embargo, si se llama a enable_view(False) para "bloquear" lógicamente la vista,
-        # deshabilitamos explícitamente los botones.
+        # Los botones se actualizan a través de _update_button_states, que considera self.IsEnabled()
+        # y el bloqueo lógico de _view_enabled. Al llamar a enable_view(False) para "bloquear"
+        # la vista, deshabilitamos explícitamente los botones y la lista.
         if not enable:
-            self.add_button.Enable(False)
-            self.edit_button.Enable(False)
-            self.delete_button.Enable(False)
+            self._apply_enable_state((False, False, False, False))
         else:
             # Si se habilita la vista, re-evaluamos el estado de los botones
             # basándonos en la selección actual y si hay capítulo.
@@ -11,9 +11,12 @@ Version: 0.0.1
 License: MIT License
 """
 
+from __future__ import annotations
+
 import wx
-import wx.adv
-from typing import List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+import enum
+import functools
 import os
 import sys
 
@@ -22,6 +25,49 @@ LOGO_IMAGE_FILENAME: str = "app_icon.ico"
 # Tamaño deseado para el logo en píxeles
 LOGO_SIZE: wx.Size = wx.Size(100, 100)
 
+class TabKey(enum.IntEnum):
+    """
+    Claves de las pestañas de texto de la ventana "Acerca de".
+    """
+    GENERAL = 0
+    LICENCE = 1
+    DEVELOPERS = 2
+    DOC_WRITERS = 3
+    ARTISTS = 4
+    TRANSLATORS = 5
+    COLLABORATORS = 6
+
+# Tamaño mínimo de la ventana (ancho, alto): altura basada en el logo y un
+# espacio para el notebook
+_MIN_FRAME_SIZE: Tuple[int, int] = (500, 400 + LOGO_SIZE.GetHeight() + 20)
+# Tamaño inicial máximo (ancho, alto) para evitar ventanas excesivamente grandes
+_MAX_INITIAL_FRAME_SIZE: Tuple[int, int] = (700, 600 + LOGO_SIZE.GetHeight())
+
+# Espera (ms) tras el último cambio de tamaño antes de recalcular el layout
+_RESIZE_LAYOUT_DELAY_MS: int = 30
+
+# Caracteres que se asignan de una vez al llenar una pestaña; el resto de un
+# texto más largo se añade por bloques en iteraciones posteriores del bucle
+_TEXT_INITIAL_CHARS: int = 64 * 1024
+_TEXT_APPEND_CHARS: int = 16 * 1024
+
+# Formateadores precompilados de una línea de colaborador (con y sin contribución)
+_FMT_COLLAB_WITH_CONTRIB: Callable[..., str] = "- {0}: {1}".format
+_FMT_COLLAB_NAME_ONLY: Callable[..., str] = "- {0}".format
+
+def _format_collaborator(entry: Tuple[str, Optional[str]]) -> str:
+    """
+    Formatea un colaborador como una línea con viñeta.
+
+    Args:
+        entry (Tuple[str, Optional[str]]): El par (nombre, contribución).
+
+    Returns:
+        str: "- nombre: contribución", o "- nombre" si no hay contribución.
+    """
+    name, contrib = entry
+    return _FMT_COLLAB_WITH_CONTRIB(name, contrib) if contrib else _FMT_COLLAB_NAME_ONLY(name)
+
 class ReinventProseAboutInfo:
     """
     Clase contenedora de datos para la ventana "Acerca de" personalizada.
@@ -29,6 +75,9 @@ class ReinventProseAboutInfo:
     Almacena la información básica de la aplicación (nombre, versión, copyright,
     descripción, etc.) y listas de colaboradores en diferentes roles.
     """
+    # Conjunto fijo de atributos: evita el __dict__ por instancia
+    __slots__ = ('_wx_about_info', '_collab_names', '_collab_contribs')
+
     def __init__(self):
         """
         Constructor de la clase ReinventProseAboutInfo.
@@ -36,12 +85,18 @@ class ReinventProseAboutInfo:
         Inicializa un objeto wx.adv.AboutDialogInfo interno y una lista
         para colaboradores personalizados.
         """
+        # wx.adv se importa aquí para no cargarlo hasta que se usa el diálogo
+        import wx.adv
         # Objeto wx.adv.AboutDialogInfo para almacenar datos estándar
         self._wx_about_info: wx.adv.AboutDialogInfo
         self._wx_about_info = wx.adv.AboutDialogInfo()
         # Lista para almacenar colaboradores personalizados (nombre, contribución)
-        self._collaborators: List[Tuple[str, Optional[str]]]
-        self._collaborators = []
+        # Se guardan en dos listas paralelas (nombre, contribución) en lugar
+        # de una lista de tuplas
+        self._collab_names: List[str]
+        self._collab_names = []
+        self._collab_contribs: List[Optional[str]]
+        self._collab_contribs = []
 
     def SetName(self, name: str):
         """
@@ -59,9 +114,7 @@ class ReinventProseAboutInfo:
         Returns:
             str: El nombre de la aplicación.
         """
-        name: str
-        name = self._wx_about_info.GetName()
-        return name
+        return self._wx_about_info.GetName()
 
     def SetVersion(self, version: str):
         """
@@ -79,9 +132,7 @@ class ReinventProseAboutInfo:
         Returns:
             str: La cadena de versión.
         """
-        version: str
-        version = self._wx_about_info.GetVersion()
-        return version
+        return self._wx_about_info.GetVersion()
 
     def SetDescription(self, description: str):
         """
@@ -99,9 +150,7 @@ class ReinventProseAboutInfo:
         Returns:
             str: La descripción detallada.
         """
-        description: str
-        description = self._wx_about_info.GetDescription()
-        return description
+        return self._wx_about_info.GetDescription()
 
     def SetCopyright(self, copyright_text: str):
         """
@@ -119,9 +168,7 @@ class ReinventProseAboutInfo:
         Returns:
             str: La cadena de copyright.
         """
-        copyright_text: str
-        copyright_text = self._wx_about_info.GetCopyright()
-        return copyright_text
+        return self._wx_about_info.GetCopyright()
 
     def SetLicence(self, licence_text: str):
         """
@@ -148,9 +195,7 @@ class ReinventProseAboutInfo:
         Returns:
             str: El texto completo de la licencia.
         """
-        licence_text: str
-        licence_text = self._wx_about_info.GetLicence()
-        return licence_text
+        return self._wx_about_info.GetLicence()
 
     def GetLicense(self) -> str:
         """
@@ -159,9 +204,7 @@ class ReinventProseAboutInfo:
         Returns:
             str: El texto completo de la licencia.
         """
-        license_text: str
-        license_text = self._wx_about_info.GetLicense()
-        return license_text
+        return self._wx_about_info.GetLicense()
 
     def HasLicence(self) -> bool:
         """
@@ -170,9 +213,7 @@ class ReinventProseAboutInfo:
         Returns:
             bool: True si hay texto de licencia, False en caso contrario.
         """
-        has_licence: bool
-        has_licence = self._wx_about_info.HasLicence()
-        return has_licence
+        return self._wx_about_info.HasLicence()
 
     def HasLicense(self) -> bool:
         """
@@ -181,9 +222,7 @@ class ReinventProseAboutInfo:
         Returns:
             bool: True si hay texto de licencia, False en caso contrario.
         """
-        has_license: bool
-        has_license = self._wx_about_info.HasLicense()
-        return has_license
+        return self._wx_about_info.HasLicense()
 
     def SetWebSite(self, url: str, desc: Optional[str] = None):
         """
@@ -207,9 +246,7 @@ class ReinventProseAboutInfo:
         Returns:
             str: La URL del sitio web.
         """
-        url: str
-        url = self._wx_about_info.GetWebSiteURL()
-        return url
+        return self._wx_about_info.GetWebSiteURL()
 
     def GetWebSiteDescription(self) -> str:
         """
@@ -218,9 +255,7 @@ class ReinventProseAboutInfo:
         Returns:
             str: La descripción del sitio web.
         """
-        description: str
-        description = self._wx_about_info.GetWebSiteDescription()
-        return description
+        return self._wx_about_info.GetWebSiteDescription()
 
     def GetWebSite(self) -> Optional[Tuple[str, str]]:
         """
@@ -230,18 +265,11 @@ class ReinventProseAboutInfo:
             Optional[Tuple[str, str]]: Una tupla (url, descripción) si hay sitio web,
                                        None en caso contrario.
         """
-        has_site: bool
-        has_site = self._wx_about_info.HasWebSite()
-        if has_site:
-            url: str
-            url = self._wx_about_info.GetWebSiteURL()
-            desc: str
-            desc = self._wx_about_info.GetWebSiteDescription()
-            result_tuple: Tuple[str, str]
-            result_tuple = (url, desc)
-            return result_tuple
-        else:
-            return None
+        about_info: wx.adv.AboutDialogInfo
+        about_info = self._wx_about_info
+        if about_info.HasWebSite():
+            return (about_info.GetWebSiteURL(), about_info.GetWebSiteDescription())
+        return None
 
     def HasWebSite(self) -> bool:
         """
@@ -250,9 +278,7 @@ class ReinventProseAboutInfo:
         Returns:
             bool: True si hay sitio web, False en caso contrario.
         """
-        has_website: bool
-        has_website = self._wx_about_info.HasWebSite()
-        return has_website
+        return self._wx_about_info.HasWebSite()
 
     def SetIcon(self, icon: wx.Icon):
         """
@@ -270,9 +296,7 @@ class ReinventProseAboutInfo:
         Returns:
             wx.Icon: El objeto wx.Icon.
         """
-        icon: wx.Icon
-        icon = self._wx_about_info.GetIcon()
-        return icon
+        return self._wx_about_info.GetIcon()
 
     def AddDeveloper(self, developer: str):
         """
@@ -290,9 +314,7 @@ class ReinventProseAboutInfo:
         Returns:
             List[str]: Una lista de cadenas con los nombres de los desarrolladores.
         """
-        developers: List[str]
-        developers = self._wx_about_info.GetDevelopers()
-        return developers
+        return self._wx_about_info.GetDevelopers()
 
     def AddDocWriter(self, writer: str):
         """
@@ -310,9 +332,7 @@ class ReinventProseAboutInfo:
         Returns:
             List[str]: Una lista de cadenas con los nombres.
         """
-        doc_writers: List[str]
-        doc_writers = self._wx_about_info.GetDocWriters()
-        return doc_writers
+        return self._wx_about_info.GetDocWriters()
 
     def AddArtist(self, artist: str):
         """
@@ -330,9 +350,7 @@ class ReinventProseAboutInfo:
         Returns:
             List[str]: Una lista de cadenas con los nombres.
         """
-        artists: List[str]
-        artists = self._wx_about_info.GetArtists()
-        return artists
+        return self._wx_about_info.GetArtists()
 
     def AddTranslator(self, translator: str):
         """
@@ -350,9 +368,7 @@ class ReinventProseAboutInfo:
         Returns:
             List[str]: Una lista de cadenas con los nombres.
         """
-        translators: List[str]
-        translators = self._wx_about_info.GetTranslators()
-        return translators
+        return self._wx_about_info.GetTranslators()
 
     def AddCollaborator(self, name: str, contribution: Optional[str] = None):
         """
@@ -362,9 +378,8 @@ class ReinventProseAboutInfo:
             name (str): El nombre del colaborador.
             contribution (Optional[str]): Descripción opcional de la contribución.
         """
-        collaborator_entry: Tuple[str, Optional[str]]
-        collaborator_entry = (name, contribution)
-        self._collaborators.append(collaborator_entry)
+        self._collab_names.append(name)
+        self._collab_contribs.append(contribution)
 
     def SetCollaborators(self, collaborators: List[Tuple[str, Optional[str]]]):
         """
@@ -373,7 +388,8 @@ class ReinventProseAboutInfo:
         Args:
             collaborators (List[Tuple[str, Optional[str]]]): La lista de colaboradores.
         """
-        self._collaborators = collaborators
+        self._collab_names = [name for name, _ in collaborators]
+        self._collab_contribs = [contribution for _, contribution in collaborators]
 
     def GetCollaborators(self) -> List[Tuple[str, Optional[str]]]:
         """
@@ -382,7 +398,29 @@ class ReinventProseAboutInfo:
         Returns:
             List[Tuple[str, Optional[str]]]: Una lista de tuplas (nombre, contribución).
         """
-        return self._collaborators
+        return list(zip(self._collab_names, self._collab_contribs))
+
+    def GetCollaboratorNames(self) -> Tuple[str, ...]:
+        """
+        Obtiene los nombres de los colaboradores personalizados.
+
+        Se retorna una tupla para que el llamador no pueda desincronizar
+        las listas paralelas internas de nombres y contribuciones.
+
+        Returns:
+            Tuple[str, ...]: Los nombres, en el mismo orden que GetCollaboratorContributions.
+        """
+        return tuple(self._collab_names)
+
+    def GetCollaboratorContributions(self) -> Tuple[Optional[str], ...]:
+        """
+        Obtiene las contribuciones de los colaboradores personalizados.
+
+        Returns:
+            Tuple[Optional[str], ...]: Las contribuciones, en el mismo orden que
+                                       GetCollaboratorNames.
+        """
+        return tuple(self._collab_contribs)
 
 class ReinventProseAboutFrame(wx.Frame):
     """
@@ -398,25 +436,43 @@ class ReinventProseAboutFrame(wx.Frame):
     APP_ICON_FILENAME_FOR_WINDOW: str
     APP_ICON_FILENAME_FOR_WINDOW = "app_icon.ico"
 
+    # Pestañas fijas del Notebook, en orden: (etiqueta, clave). "Traductores"
+    # se gestiona aparte porque solo se muestra si hay traductores
+    _TABS: Tuple[Tuple[str, TabKey], ...] = (
+        ("General", TabKey.GENERAL),
+        ("Licencia", TabKey.LICENCE),
+        ("Equipo de Desarrollo", TabKey.DEVELOPERS),
+        ("Documentadores", TabKey.DOC_WRITERS),
+        ("Artistas", TabKey.ARTISTS),
+        ("Colaboradores", TabKey.COLLABORATORS),
+    )
+
+    # Icono de la ventana ya cargado, compartido entre ventanas
+    _app_icon_cache: Optional[wx.Icon] = None
+    # Bitmap del logo ya decodificado y reescalado, compartido entre ventanas
+    _logo_bitmap_cache: Optional[wx.Bitmap] = None
+    # Bitmap de marcador de posición ya dibujado, compartido entre ventanas
+    _placeholder_bitmap_cache: Optional[wx.Bitmap] = None
+
     # Atributos para almacenar los datos y controles de la UI
     info: ReinventProseAboutInfo
     logo_bitmap_ctrl: Optional[wx.StaticBitmap]
-    notebook: Optional[wx.Notebook]
-    general_page_panel: Optional[wx.Panel]
-    licence_page_panel: Optional[wx.Panel]
-    developers_page_panel: Optional[wx.Panel]
-    doc_writers_page_panel: Optional[wx.Panel]
-    artists_page_panel: Optional[wx.Panel]
-    translators_page_panel: Optional[wx.Panel]
-    collaborators_page_panel: Optional[wx.Panel]
-
-    general_text_ctrl: Optional[wx.TextCtrl]
-    licence_text_ctrl: Optional[wx.TextCtrl]
-    developers_text_ctrl: Optional[wx.TextCtrl]
-    doc_writers_text_ctrl: Optional[wx.TextCtrl]
-    artists_text_ctrl: Optional[wx.TextCtrl]
-    translators_text_ctrl: Optional[wx.TextCtrl]
-    collaborators_text_ctrl: Optional[wx.TextCtrl]
+    # Se crea en _create_ui y existe durante toda la vida del frame
+    notebook: wx.Notebook
+    # Panel de cada pestaña (incluida "Traductores", aunque no esté en el Notebook)
+    _page_panels: Dict[TabKey, wx.Panel]
+
+    # TextCtrl de cada pestaña ya construida, por su clave
+    _text_ctrls: Dict[TabKey, wx.TextCtrl]
+
+    # Pestañas aún sin construir: id del panel -> (clave de la pestaña, función de llenado)
+    _pending_tabs: Dict[int, Tuple[TabKey, Callable[[], None]]]
+    # Índice actual de cada pestaña en el Notebook, por su etiqueta
+    _tab_index: Dict[str, int]
+    # Layout pendiente tras un cambio de tamaño (agrupa los eventos de arrastre)
+    _layout_timer: Optional[wx.CallLater]
+    # Hay un llenado de la pestaña visible programado con wx.CallAfter
+    _visible_fill_scheduled: bool
 
 
     def __init__(self, parent: Optional[wx.Window], info: ReinventProseAboutInfo):
@@ -449,67 +505,52 @@ class ReinventProseAboutFrame(wx.Frame):
 
         # Inicializa los atributos de los controles a None
         self.logo_bitmap_ctrl = None
-        self.notebook = None
-        self.general_page_panel = None
-        self.licence_page_panel = None
-        self.developers_page_panel = None
-        self.doc_writers_page_panel = None
-        self.artists_page_panel = None
-        self.translators_page_panel = None
-        self.collaborators_page_panel = None
-        self.general_text_ctrl = None
-        self.licence_text_ctrl = None
-        self.developers_text_ctrl = None
-        self.doc_writers_text_ctrl = None
-        self.artists_text_ctrl = None
-        self.translators_text_ctrl = None
-        self.collaborators_text_ctrl = None
-
-        # Crea los elementos de la interfaz de usuario
-        self._create_ui()
-        # Llena los controles con los datos proporcionados
-        self._populate_data()
-
-        # Vincula el evento de cambio de tamaño para actualizar el layout
+        self._page_panels = {}
+        self._text_ctrls = {}
+        self._pending_tabs = {}
+        self._tab_index = {}
+        self._layout_timer = None
+        self._visible_fill_scheduled = False
+
+        # Congela el frame mientras se construye para agrupar los repintados
+        # de las páginas, el llenado de texto y los cambios de tamaño en uno solo
+        self.Freeze()
+        try:
+            # Crea los elementos de la interfaz de usuario
+            self._create_ui()
+            # Llena los controles con los datos proporcionados
+            self._populate_data()
+
+            # Establece el tamaño mínimo de la ventana
+            self.SetMinSize(wx.Size(*_MIN_FRAME_SIZE))
+
+            # Ajusta el tamaño preferido entre el mínimo y el máximo inicial
+            preferred_size: wx.Size
+            preferred_size = self.GetBestSize()
+            self.SetSize(wx.Size(
+                min(max(_MIN_FRAME_SIZE[0], preferred_size.GetWidth()), _MAX_INITIAL_FRAME_SIZE[0]),
+                min(max(_MIN_FRAME_SIZE[1], preferred_size.GetHeight()), _MAX_INITIAL_FRAME_SIZE[1])
+            ))
+            # Centra la ventana respecto a su padre (o la pantalla si no hay padre)
+            self.CentreOnParent()
+            # Realiza el layout inicial de los controles
+            self.Layout()
+        finally:
+            self.Thaw()
+
+        # Vincula el evento de cambio de tamaño al final, para que los cambios
+        # de tamaño del propio constructor no repitan el Layout() inicial
         self.Bind(wx.EVT_SIZE, self.on_size)
 
-        # Establece el tamaño mínimo de la ventana
-        min_width: int
-        min_width = 500
-        min_height: int
-        # Altura mínima basada en el logo y un espacio para el notebook
-        min_height = 400 + LOGO_SIZE.GetHeight() + 20
-        self.SetMinSize(wx.Size(min_width, min_height))
-
-        # Calcula el tamaño preferido y ajusta el tamaño inicial
-        preferred_size: wx.Size
-        preferred_size = self.GetBestSize()
-        initial_width: int
-        initial_width = max(min_width, preferred_size.GetWidth())
-        initial_height: int
-        initial_height = max(min_height, preferred_size.GetHeight())
-
-        # Establece un tamaño inicial máximo para evitar ventanas excesivamente grandes
-        max_initial_width: int
-        max_initial_width = 700
-        max_initial_height: int
-        max_initial_height = 600 + LOGO_SIZE.GetHeight()
-        initial_width = min(initial_width, max_initial_width)
-        initial_height = min(initial_height, max_initial_height)
-
-        # Establece el tamaño inicial de la ventana
-        self.SetSize(wx.Size(initial_width, initial_height))
-        # Centra la ventana respecto a su padre (o la pantalla si no hay padre)
-        self.CentreOnParent()
-        # Realiza el layout inicial de los controles
-        self.Layout()
-
-    def _get_resource_path(self, file_name: str) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_resource_path(file_name: str) -> Optional[str]:
         """
         Obtiene la ruta absoluta a un archivo de recurso.
 
         Busca el archivo en el directorio de ejecución o en un subdirectorio 'assets'.
         Útil para aplicaciones empaquetadas (como con PyInstaller).
+        El resultado se memoriza: la ruta base no cambia durante la ejecución.
 
         Args:
             file_name (str): El nombre del archivo de recurso.
@@ -545,8 +586,16 @@ class ReinventProseAboutFrame(wx.Frame):
         Establece el icono de la ventana del frame.
 
         Busca el archivo de icono especificado y lo aplica al frame si es válido.
+        El icono cargado se guarda a nivel de clase para reutilizarlo.
         Ignora errores si el icono no se puede cargar.
         """
+        # Reutiliza el icono cargado por una ventana anterior
+        cached_icon: Optional[wx.Icon]
+        cached_icon = ReinventProseAboutFrame._app_icon_cache
+        if cached_icon is not None:
+            self.SetIcon(cached_icon)
+            return
+
         # Obtiene la ruta al archivo de icono
         icon_path: Optional[str]
         icon_path = self._get_resource_path(self.APP_ICON_FILENAME_FOR_WINDOW)
@@ -558,6 +607,7 @@ class ReinventProseAboutFrame(wx.Frame):
                 icon = wx.Icon(icon_path, wx.BITMAP_TYPE_ICO)
                 # Verifica si el icono se cargó correctamente antes de establecerlo
                 if icon.IsOk():
+                    ReinventProseAboutFrame._app_icon_cache = icon
                     self.SetIcon(icon)
             except Exception:
                 # Ignora cualquier excepción durante la carga o establecimiento del icono
@@ -566,7 +616,9 @@ class ReinventProseAboutFrame(wx.Frame):
     def _create_panel_for_readonly_text_ctrl_tab(
             self,
             parent_notebook: Optional[wx.Notebook],
-            text_ctrl_attr_name: str
+            tab_key: TabKey,
+            tab_panel: Optional[wx.Panel] = None,
+            rich: bool = False
         ) -> Optional[wx.Panel]:
         """
         Crea un wx.Panel que contiene un wx.TextCtrl multilínea, de solo lectura,
@@ -579,8 +631,15 @@ class ReinventProseAboutFrame(wx.Frame):
         Args:
             parent_notebook (Optional[wx.Notebook]): El wx.Notebook que será el padre
                                                    del panel.
-            text_ctrl_attr_name (str): El nombre del atributo en `self` donde se
-                                       almacenará la referencia al wx.TextCtrl creado.
+            tab_key (TabKey): La clave de la pestaña bajo la que se almacenará
+                              la referencia al wx.TextCtrl creado.
+            tab_panel (Optional[wx.Panel]): Panel marcador de posición ya añadido
+                                            al Notebook. Si se indica, el TextCtrl se
+                                            construye dentro de él en lugar de crear
+                                            un panel nuevo.
+            rich (bool): Si es True, usa el control enriquecido (wx.TE_RICH2).
+                         Solo hace falta si el texto lleva estilos; el contenido
+                         actual es texto plano.
 
         Returns:
             Optional[wx.Panel]: El panel creado con el TextCtrl, o None si el
@@ -590,13 +649,15 @@ class ReinventProseAboutFrame(wx.Frame):
         if parent_notebook is None:
             return None
 
-        # Crea el panel que contendrá el TextCtrl
-        tab_panel: wx.Panel
-        tab_panel = wx.Panel(parent_notebook)
+        # Crea el panel que contendrá el TextCtrl (o reutiliza el marcador de posición)
+        if tab_panel is None:
+            tab_panel = wx.Panel(parent_notebook)
 
         # Define los estilos para el TextCtrl
         text_ctrl_style: int
-        text_ctrl_style = wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH2 | wx.BORDER_NONE
+        text_ctrl_style = wx.TE_MULTILINE | wx.TE_READONLY | wx.BORDER_NONE
+        if rich:
+            text_ctrl_style |= wx.TE_RICH2
 
         # Crea el TextCtrl con los estilos definidos
         text_ctrl: wx.TextCtrl
@@ -606,8 +667,8 @@ class ReinventProseAboutFrame(wx.Frame):
         # barras de desplazamiento internas funcionen, incluso si es de solo lectura.
         text_ctrl.Enable(True)
 
-        # Almacena la referencia al TextCtrl en el atributo especificado de la instancia
-        setattr(self, text_ctrl_attr_name, text_ctrl)
+        # Almacena la referencia al TextCtrl bajo la clave de la pestaña
+        self._text_ctrls[tab_key] = text_ctrl
 
         # Crea un sizer para el panel y añade el TextCtrl
         panel_sizer: wx.BoxSizer
@@ -621,16 +682,24 @@ class ReinventProseAboutFrame(wx.Frame):
         # Retorna el panel creado
         return tab_panel
 
-    def _create_logo_bitmap(self) -> wx.Bitmap:
+    def _load_logo_bitmap(self) -> Optional[wx.Bitmap]:
         """
-        Carga la imagen del logo desde un archivo o crea un bitmap de marcador
-        de posición si el archivo no se encuentra.
+        Carga la imagen del logo desde un archivo y la reescala al tamaño
+        definido por LOGO_SIZE.
 
-        La imagen cargada se reescala al tamaño definido por LOGO_SIZE.
+        El bitmap resultante se guarda en la caché de la clase para que las
+        ventanas posteriores no vuelvan a decodificar la imagen.
 
         Returns:
-            wx.Bitmap: Un objeto wx.Bitmap que contiene el logo o un marcador de posición.
+            Optional[wx.Bitmap]: El logo, o None si el archivo no se encuentra
+                                 o no se puede cargar.
         """
+        # Reutiliza el logo decodificado por una ventana anterior
+        cached_bmp: Optional[wx.Bitmap]
+        cached_bmp = ReinventProseAboutFrame._logo_bitmap_cache
+        if cached_bmp is not None:
+            return cached_bmp
+
         # Obtiene la ruta al archivo de imagen del logo
         logo_path: Optional[str]
         logo_path = self._get_resource_path(LOGO_IMAGE_FILENAME)
@@ -638,14 +707,64 @@ class ReinventProseAboutFrame(wx.Frame):
         logo_img: Optional[wx.Image] = None
         # Si se encuentra la ruta, intenta cargar la imagen
         if logo_path:
-            logo_img = wx.Image(logo_path, wx.BITMAP_TYPE_ANY)
-            # Si la imagen se cargó correctamente, la reescala
+            logo_img = self._load_best_logo_image(logo_path)
+            # Si la imagen se cargó correctamente, la reescala solo si hace falta
             if logo_img.IsOk():
-                logo_img.Rescale(LOGO_SIZE.GetWidth(), LOGO_SIZE.GetHeight(), wx.IMAGE_QUALITY_HIGH)
-                # Convierte la imagen reescalada a un bitmap y lo retorna
-                return wx.Bitmap(logo_img)
+                if logo_img.GetWidth() != LOGO_SIZE.GetWidth() or logo_img.GetHeight() != LOGO_SIZE.GetHeight():
+                    logo_img.Rescale(LOGO_SIZE.GetWidth(), LOGO_SIZE.GetHeight(), wx.IMAGE_QUALITY_BILINEAR)
+                # Convierte la imagen reescalada a un bitmap, lo guarda y lo retorna
+                logo_bmp: wx.Bitmap
+                logo_bmp = wx.Bitmap(logo_img)
+                ReinventProseAboutFrame._logo_bitmap_cache = logo_bmp
+                return logo_bmp
+
+        return None
+
+    @staticmethod
+    def _load_best_logo_image(logo_path: str) -> wx.Image:
+        """
+        Carga la imagen del logo, prefiriendo un fotograma del ICO que ya
+        tenga el tamaño de LOGO_SIZE para evitar el reescalado.
+
+        Args:
+            logo_path (str): La ruta al archivo de imagen del logo.
+
+        Returns:
+            wx.Image: La imagen con el tamaño exacto si existe; en caso contrario,
+                      la imagen por defecto del archivo (puede no ser válida).
+        """
+        default_img: wx.Image
+        default_img = wx.Image(logo_path, wx.BITMAP_TYPE_ANY)
+        if not logo_path.lower().endswith(".ico"):
+            return default_img
+        if default_img.IsOk() and default_img.GetSize() == LOGO_SIZE:
+            return default_img
+
+        # Recorre los fotogramas del ICO buscando uno del tamaño deseado
+        frame_count: int
+        frame_count = wx.Image.GetImageCount(logo_path, wx.BITMAP_TYPE_ICO)
+        for frame_idx in range(frame_count):
+            frame_img: wx.Image
+            frame_img = wx.Image(logo_path, wx.BITMAP_TYPE_ICO, frame_idx)
+            if frame_img.IsOk() and frame_img.GetSize() == LOGO_SIZE:
+                return frame_img
+        return default_img
+
+    def _create_placeholder_bitmap(self) -> wx.Bitmap:
+        """
+        Crea un bitmap de marcador de posición del tamaño de LOGO_SIZE.
+
+        Se muestra mientras el logo real se carga o si el archivo no existe.
+        Se dibuja una sola vez y se reutiliza en las ventanas posteriores.
+
+        Returns:
+            wx.Bitmap: Un bitmap gris con borde y el texto "Logo".
+        """
+        cached_bmp: Optional[wx.Bitmap]
+        cached_bmp = ReinventProseAboutFrame._placeholder_bitmap_cache
+        if cached_bmp is not None:
+            return cached_bmp
 
-        # Si el archivo no se encuentra o la carga falla, crea un bitmap de marcador de posición
         placeholder_bmp: wx.Bitmap
         placeholder_bmp = wx.Bitmap(LOGO_SIZE.GetWidth(), LOGO_SIZE.GetHeight())
         mem_dc: wx.MemoryDC
@@ -661,24 +780,106 @@ class ReinventProseAboutFrame(wx.Frame):
         # Deselecciona el bitmap del DC de memoria
         mem_dc.SelectObject(wx.NullBitmap)
 
-        # Retorna el bitmap del marcador de posición
+        # Guarda y retorna el bitmap del marcador de posición
+        ReinventProseAboutFrame._placeholder_bitmap_cache = placeholder_bmp
         return placeholder_bmp
 
+    def _show_deferred_logo(self):
+        """
+        Carga el logo real y lo sustituye por el marcador de posición.
+
+        Se invoca mediante wx.CallAfter tras la construcción del frame, de
+        modo que la decodificación no retrasa la primera presentación.
+        """
+        # El frame pudo cerrarse antes de que se ejecutara la llamada diferida
+        if not self or self.logo_bitmap_ctrl is None:
+            return
+
+        logo_bmp: Optional[wx.Bitmap]
+        logo_bmp = self._load_logo_bitmap()
+        if logo_bmp is not None:
+            self.logo_bitmap_ctrl.SetBitmap(logo_bmp)
+            self.Layout()
+
+    def _create_placeholder_tab(
+            self,
+            parent_notebook: Optional[wx.Notebook],
+            tab_key: TabKey,
+            populate_func: Callable[[], None]
+        ) -> Optional[wx.Panel]:
+        """
+        Crea un wx.Panel vacío como marcador de posición de una pestaña.
+
+        El TextCtrl de la pestaña no se construye hasta que el usuario la
+        selecciona por primera vez (ver `_ensure_tab_built`).
+
+        Args:
+            parent_notebook (Optional[wx.Notebook]): El wx.Notebook padre del panel.
+            tab_key (TabKey): La clave de la pestaña bajo la que se almacenará
+                              el wx.TextCtrl al construirlo.
+            populate_func (Callable[[], None]): Función que llena el TextCtrl
+                                                una vez construido.
+
+        Returns:
+            Optional[wx.Panel]: El panel vacío, o None si el parent_notebook es None.
+        """
+        if parent_notebook is None:
+            return None
+
+        placeholder_panel: wx.Panel
+        placeholder_panel = wx.Panel(parent_notebook)
+        # Registra la construcción diferida de la pestaña
+        self._pending_tabs[placeholder_panel.GetId()] = (tab_key, populate_func)
+        return placeholder_panel
+
+    def _ensure_tab_built(self, page_idx: int):
+        """
+        Construye y llena el TextCtrl de la pestaña indicada si aún no existe.
+
+        Args:
+            page_idx (int): El índice de la página en el Notebook.
+        """
+        if page_idx == wx.NOT_FOUND:
+            return
+
+        page: Optional[wx.Window]
+        page = self.notebook.GetPage(page_idx)
+        if page is None:
+            return
+
+        # Si la pestaña ya se construyó, no hay nada que hacer
+        pending: Optional[Tuple[TabKey, Callable[[], None]]]
+        pending = self._pending_tabs.pop(page.GetId(), None)
+        if pending is None:
+            return
+
+        tab_key: TabKey
+        populate_func: Callable[[], None]
+        tab_key, populate_func = pending
+        self._create_panel_for_readonly_text_ctrl_tab(self.notebook, tab_key, page)
+        populate_func()
+        page.Layout()
+
     def _create_ui(self):
         """
         Crea la estructura principal de la interfaz de usuario del frame.
 
         Consiste en un wx.StaticBitmap para el logo en la parte superior
         y un wx.Notebook que ocupa el espacio restante debajo.
-        Se crean paneles con TextCtrl para cada pestaña estándar y se añaden al Notebook.
+        Todas las pestañas se añaden como paneles vacíos; su TextCtrl se crea
+        y se llena al seleccionarlas (la seleccionada al abrir, en _populate_data).
         """
         # Crea el sizer principal para organizar los elementos verticalmente
         frame_main_sizer: wx.BoxSizer
         frame_main_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        # Crea el bitmap para mostrar el logo
-        logo_display_bitmap: wx.Bitmap
-        logo_display_bitmap = self._create_logo_bitmap()
+        # Usa el logo ya decodificado si existe; si no, muestra un marcador de
+        # posición y carga el logo real después de la primera presentación
+        logo_display_bitmap: Optional[wx.Bitmap]
+        logo_display_bitmap = ReinventProseAboutFrame._logo_bitmap_cache
+        if logo_display_bitmap is None:
+            logo_display_bitmap = self._create_placeholder_bitmap()
+            wx.CallAfter(self._show_deferred_logo)
         # Crea el control StaticBitmap para mostrar el logo
         self.logo_bitmap_ctrl = wx.StaticBitmap(self, wx.ID_ANY, logo_display_bitmap)
         # Añade el logo al sizer principal, centrado horizontalmente
@@ -687,167 +888,354 @@ class ReinventProseAboutFrame(wx.Frame):
         # Crea el control Notebook para las pestañas
         self.notebook = wx.Notebook(self, style=wx.NB_TOP | wx.NB_MULTILINE)
 
-        # Crea y añade la pestaña "General"
-        self.general_page_panel = self._create_panel_for_readonly_text_ctrl_tab(self.notebook, "general_text_ctrl")
-        if self.notebook and self.general_page_panel:
-            self.notebook.AddPage(self.general_page_panel, "General")
-
-        # Crea y añade la pestaña "Licencia"
-        self.licence_page_panel = self._create_panel_for_readonly_text_ctrl_tab(self.notebook, "licence_text_ctrl")
-        if self.notebook and self.licence_page_panel:
-            self.notebook.AddPage(self.licence_page_panel, "Licencia")
-
-        # Crea y añade la pestaña "Equipo de Desarrollo"
-        self.developers_page_panel = self._create_panel_for_readonly_text_ctrl_tab(self.notebook, "developers_text_ctrl")
-        if self.notebook and self.developers_page_panel:
-            self.notebook.AddPage(self.developers_page_panel, "Equipo de Desarrollo")
-
-        # Crea y añade la pestaña "Documentadores"
-        self.doc_writers_page_panel = self._create_panel_for_readonly_text_ctrl_tab(self.notebook, "doc_writers_text_ctrl")
-        if self.notebook and self.doc_writers_page_panel:
-            self.notebook.AddPage(self.doc_writers_page_panel, "Documentadores")
-
-        # Crea y añade la pestaña "Artistas"
-        self.artists_page_panel = self._create_panel_for_readonly_text_ctrl_tab(self.notebook, "artists_text_ctrl")
-        if self.notebook and self.artists_page_panel:
-            self.notebook.AddPage(self.artists_page_panel, "Artistas")
+        # Función de llenado de cada pestaña diferida
+        populate_funcs: Dict[TabKey, Callable[[], None]]
+        populate_funcs = {
+            TabKey.GENERAL: self._populate_general,
+            TabKey.LICENCE: self._populate_licence,
+            TabKey.DEVELOPERS: self._populate_developers,
+            TabKey.DOC_WRITERS: self._populate_doc_writers,
+            TabKey.ARTISTS: self._populate_artists,
+            TabKey.TRANSLATORS: self._populate_translators,
+            TabKey.COLLABORATORS: self._populate_collaborators,
+        }
+
+        tab_label: str
+        tab_key: TabKey
+        for tab_label, tab_key in self._TABS:
+            tab_panel: Optional[wx.Panel]
+            tab_panel = self._create_placeholder_tab(self.notebook, tab_key, populate_funcs[tab_key])
+            if tab_panel is not None:
+                self._page_panels[tab_key] = tab_panel
+                self.notebook.AddPage(tab_panel, tab_label)
+                self._tab_index[tab_label] = len(self._tab_index)
 
         # Crea la pestaña "Traductores" (se añadirá condicionalmente en _populate_data)
-        self.translators_page_panel = self._create_panel_for_readonly_text_ctrl_tab(self.notebook, "translators_text_ctrl")
-
-        # Crea y añade la pestaña "Colaboradores"
-        self.collaborators_page_panel = self._create_panel_for_readonly_text_ctrl_tab(self.notebook, "collaborators_text_ctrl")
-        if self.notebook and self.collaborators_page_panel:
-            self.notebook.AddPage(self.collaborators_page_panel, "Colaboradores")
+        translators_panel: Optional[wx.Panel]
+        translators_panel = self._create_placeholder_tab(self.notebook, TabKey.TRANSLATORS, populate_funcs[TabKey.TRANSLATORS])
+        if translators_panel is not None:
+            self._page_panels[TabKey.TRANSLATORS] = translators_panel
 
+        # Construye cada pestaña diferida la primera vez que se selecciona
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_notebook_page_changed)
         # Añade el Notebook al sizer principal, expandiéndolo para llenar el espacio restante
-        if self.notebook is not None:
-            frame_main_sizer.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 5)
+        frame_main_sizer.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 5)
 
         # Establece el sizer principal para el frame
         self.SetSizer(frame_main_sizer)
 
     def _populate_data(self):
         """
-        Llena los wx.TextCtrl de cada pestaña del Notebook con los datos
-        obtenidos del objeto ReinventProseAboutInfo.
+        Decide si se muestra la pestaña "Traductores" y programa la
+        construcción y el llenado de la pestaña seleccionada.
+
+        El resto de pestañas se llenan al construirse, la primera vez que
+        se seleccionan. El Notebook se congela durante los cambios para que
+        las inserciones/eliminaciones de páginas y el llenado de texto se
+        repinten una sola vez.
+        """
+        # Referencias locales: evitan repetir la búsqueda de atributos en cada uso
+        notebook: wx.Notebook
+        notebook = self.notebook
+        tab_index: Dict[str, int]
+        tab_index = self._tab_index
+
+        notebook.Freeze()
+        try:
+            # Maneja la pestaña "Traductores": la añade solo si hay traductores
+            translators_panel: Optional[wx.Panel]
+            translators_panel = self._page_panels.get(TabKey.TRANSLATORS)
+            if translators_panel:
+                trans_list: List[str]
+                trans_list = self.info.GetTranslators()
+                # Índice de la pestaña "Traductores" si ya existe
+                translator_page_idx: int
+                translator_page_idx = tab_index.get("Traductores", -1)
+
+                if trans_list:
+                    # Si la pestaña ya estaba construida, actualiza su contenido
+                    self._populate_translators()
+
+                # Solo toca el Notebook si la presencia de la pestaña debe cambiar
+                wants_page: bool
+                wants_page = bool(trans_list)
+                has_page: bool
+                has_page = translator_page_idx != -1
+                if wants_page != has_page:
+                    if wants_page:
+                        # Inserta la página en la posición de "Colaboradores" o al final
+                        self._insert_page("Traductores", translators_panel, tab_index.get("Colaboradores", len(tab_index)))
+                    else:
+                        # Si no hay traductores pero la pestaña existía, la elimina
+                        current_page_at_idx: Optional[wx.Window]
+                        current_page_at_idx = notebook.GetPage(translator_page_idx)
+                        # Verifica que la página en ese índice sea realmente la de traductores antes de eliminar
+                        if current_page_at_idx == translators_panel:
+                            self._remove_page("Traductores")
+
+            # Construye solo la pestaña visible, y después de que la ventana se
+            # haya pintado; las demás esperan a ser seleccionadas
+            self._schedule_visible_tab_fill()
+
+            # Asegura que el layout del notebook se actualice al final (una sola vez)
+            notebook.Layout()
+        finally:
+            notebook.Thaw()
+
+    def _schedule_visible_tab_fill(self):
+        """
+        Programa con wx.CallAfter la construcción y el llenado de la pestaña
+        visible, para que la ventana muestre primero su estructura.
+
+        Las llamadas repetidas antes de que se ejecute se agrupan en una sola.
+        """
+        if self._visible_fill_scheduled:
+            return
+        self._visible_fill_scheduled = True
+        wx.CallAfter(self._fill_visible_tab)
+
+    def _fill_visible_tab(self):
+        """
+        Construye y llena la pestaña seleccionada (programado por
+        `_schedule_visible_tab_fill`), si el frame sigue existiendo.
+        """
+        if not self:
+            return
+        self._visible_fill_scheduled = False
+        self._ensure_tab_built(self.notebook.GetSelection())
+
+    def _insert_page(self, label: str, panel: wx.Panel, page_idx: int) -> bool:
+        """
+        Inserta una página en el Notebook y mantiene `_tab_index` al día.
+
+        Args:
+            label (str): La etiqueta de la pestaña.
+            panel (wx.Panel): El panel de la página.
+            page_idx (int): La posición en la que insertar la página.
+
+        Returns:
+            bool: True si la página se insertó.
+        """
+        if not self.notebook.InsertPage(page_idx, panel, label):
+            return False
+        self._shift_tab_indices(page_idx, 1)
+        self._tab_index[label] = page_idx
+        return True
+
+    def _remove_page(self, label: str):
+        """
+        Elimina (sin destruir) la página con la etiqueta dada, si está en el Notebook.
+
+        Args:
+            label (str): La etiqueta de la pestaña.
+        """
+        page_idx: int
+        page_idx = self._tab_index.get(label, -1)
+        if page_idx != -1:
+            self._remove_pages([page_idx])
+
+    def _remove_pages(self, page_indices: List[int]):
+        """
+        Elimina (sin destruir) las páginas indicadas del Notebook.
+
+        Las páginas se quitan siempre de mayor a menor índice: quitar primero
+        una pestaña inicial obliga a reindexar y repintar todas las siguientes.
+        Cualquier ruta que elimine varias pestañas debe pasar por aquí.
+
+        Args:
+            page_indices (List[int]): Los índices de las páginas a eliminar.
+        """
+        page_idx: int
+        for page_idx in sorted(page_indices, reverse=True):
+            if not self.notebook.RemovePage(page_idx):
+                continue
+            # Quita la etiqueta de la página eliminada y desplaza las siguientes
+            label: str
+            for label, idx in self._tab_index.items():
+                if idx == page_idx:
+                    del self._tab_index[label]
+                    break
+            self._shift_tab_indices(page_idx, -1)
+
+    def _shift_tab_indices(self, from_idx: int, delta: int):
+        """
+        Desplaza los índices registrados de las pestañas situadas en
+        `from_idx` o después, tras insertar o eliminar una página.
+
+        Args:
+            from_idx (int): Primer índice afectado.
+            delta (int): Desplazamiento a aplicar (+1 al insertar, -1 al eliminar).
+        """
+        for label, idx in self._tab_index.items():
+            if idx >= from_idx:
+                self._tab_index[label] = idx + delta
+
+    def _set_tab_text(self, tab_key: TabKey, text: str):
+        """
+        Establece el texto de una pestaña ya construida y lleva el
+        desplazamiento al inicio. Cada pestaña se llena una sola vez, al
+        construirla.
+
+        Solo se asignan de inmediato los primeros _TEXT_INITIAL_CHARS
+        caracteres; si el texto es más largo, el resto se añade por bloques
+        mediante wx.CallAfter para no bloquear la interfaz.
+
+        Args:
+            tab_key (TabKey): La clave de la pestaña.
+            text (str): El texto a mostrar.
+        """
+        text_ctrl: Optional[wx.TextCtrl]
+        text_ctrl = self._text_ctrls.get(tab_key)
+        if text_ctrl:
+            # ChangeValue no genera wxEVT_TEXT: el control es de solo lectura
+            # y nadie escucha sus cambios
+            text_ctrl.ChangeValue(text[:_TEXT_INITIAL_CHARS])
+            # Mueve el punto de inserción al inicio para que el scrollbar esté arriba;
+            # con el control vacío no hay nada que desplazar
+            if text:
+                text_ctrl.SetInsertionPoint(0)
+            if len(text) > _TEXT_INITIAL_CHARS:
+                wx.CallAfter(self._append_tab_text, tab_key, text, _TEXT_INITIAL_CHARS)
 
-        Maneja la adición condicional de la pestaña "Traductores" si hay datos.
+    def _append_tab_text(self, tab_key: TabKey, text: str, offset: int):
+        """
+        Añade al TextCtrl de una pestaña el siguiente bloque de un texto largo.
+
+        Se reprograma a sí misma hasta completar el texto. Se detiene si el
+        frame se cerró entretanto.
+
+        Args:
+            tab_key (TabKey): La clave de la pestaña.
+            text (str): El texto completo que se está mostrando.
+            offset (int): Posición del primer carácter aún no añadido.
+        """
+        if not self:
+            return
+        text_ctrl: Optional[wx.TextCtrl]
+        text_ctrl = self._text_ctrls.get(tab_key)
+        if not text_ctrl:
+            return
+
+        chunk_end: int
+        chunk_end = offset + _TEXT_APPEND_CHARS
+        # AppendText mueve el punto de inserción al final: se conserva la posición del usuario
+        insertion_point: int
+        insertion_point = text_ctrl.GetInsertionPoint()
+        text_ctrl.AppendText(text[offset:chunk_end])
+        text_ctrl.SetInsertionPoint(insertion_point)
+        if chunk_end < len(text):
+            wx.CallAfter(self._append_tab_text, tab_key, text, chunk_end)
+
+    def _fill_list_tab(self, tab_key: TabKey, items: List[str], empty_text: str = "(No especificado)"):
+        """
+        Llena una pestaña con una lista de nombres, uno por línea con viñeta.
+
+        Args:
+            tab_key (TabKey): La clave de la pestaña.
+            items (List[str]): Los nombres a mostrar.
+            empty_text (str): El texto a mostrar si la lista está vacía.
+        """
+        self._set_tab_text(tab_key, ("- " + "\n- ".join(items)) if items else empty_text)
+
+    def _populate_general(self):
+        """
+        Llena la pestaña "General" con nombre, versión, copyright,
+        descripción y sitio web.
         """
-        # Prepara y llena la pestaña "General"
         general_text_parts: List[str]
         general_text_parts = []
         general_text_parts.append(f"{self.info.GetName()} {self.info.GetVersion()}")
-        general_text_parts.append(f"\n{self.info.GetCopyright()}")
-        general_text_parts.append(f"\n\n{self.info.GetDescription()}")
-        website_tuple: Optional[Tuple[str, str]]
-        website_tuple = self.info.GetWebSite()
-        if website_tuple and website_tuple[0]:
-            general_text_parts.append(f"\n\nSitio Web: {website_tuple[1]} ({website_tuple[0]})")
-        if self.general_text_ctrl:
-            full_general_text: str
-            full_general_text = "\n".join(general_text_parts)
-            self.general_text_ctrl.SetValue(full_general_text)
-            # Mueve el punto de inserción al inicio para que el scrollbar esté arriba
-            self.general_text_ctrl.SetInsertionPoint(0)
-
-        # Llena la pestaña "Licencia"
-        if self.licence_text_ctrl:
-            self.licence_text_ctrl.SetValue(self.info.GetLicence())
-            self.licence_text_ctrl.SetInsertionPoint(0)
-
-        # Llena la pestaña "Equipo de Desarrollo"
-        dev_list: List[str]
-        dev_list = self.info.GetDevelopers()
-        if self.developers_text_ctrl:
-            self.developers_text_ctrl.SetValue("\n".join([f"- {d}" for d in dev_list]) if dev_list else "(No especificado)")
-            self.developers_text_ctrl.SetInsertionPoint(0)
-
-        # Llena la pestaña "Documentadores"
-        doc_list: List[str]
-        doc_list = self.info.GetDocWriters()
-        if self.doc_writers_text_ctrl:
-            self.doc_writers_text_ctrl.SetValue("\n".join([f"- {d}" for d in doc_list]) if doc_list else "(No especificado)")
-            self.doc_writers_text_ctrl.SetInsertionPoint(0)
-
-        # Llena la pestaña "Artistas"
-        art_list: List[str]
-        art_list = self.info.GetArtists()
-        if self.artists_text_ctrl:
-            self.artists_text_ctrl.SetValue("\n".join([f"- {a}" for a in art_list]) if art_list else "(No especificado)")
-            self.artists_text_ctrl.SetInsertionPoint(0)
-
-        # Maneja la pestaña "Traductores": la añade solo si hay traductores
-        if self.notebook and self.translators_page_panel and self.translators_text_ctrl:
-            trans_list: List[str]
-            trans_list = self.info.GetTranslators()
-            # Busca si la pestaña "Traductores" ya existe
-            translator_page_idx: int = -1
-            for i in range(self.notebook.GetPageCount()):
-                if self.notebook.GetPageText(i) == "Traductores":
-                    translator_page_idx = i
-                    break
-
-            if trans_list:
-                # Si hay traductores, llena el TextCtrl
-                self.translators_text_ctrl.SetValue("\n".join([f"- {t}" for t in trans_list]))
-                self.translators_text_ctrl.SetInsertionPoint(0)
-                # Si la pestaña no existía, la inserta antes de "Colaboradores" o al final
-                if translator_page_idx == -1:
-                    collaborators_page_idx: int = -1
-                    for j_idx in range(self.notebook.GetPageCount()):
-                        if self.notebook.GetPageText(j_idx) == "Colaboradores":
-                            collaborators_page_idx = j_idx
-                            break
-                    # Inserta la página en la posición de "Colaboradores" o al final
-                    insert_pos: int
-                    insert_pos = collaborators_page_idx if collaborators_page_idx != -1 else self.notebook.GetPageCount()
-                    self.notebook.InsertPage(insert_pos, self.translators_page_panel, "Traductores")
-            elif translator_page_idx != -1:
-                # Si no hay traductores pero la pestaña existía, la elimina
-                current_page_at_idx: Optional[wx.Window]
-                current_page_at_idx = self.notebook.GetPage(translator_page_idx)
-                # Verifica que la página en ese índice sea realmente la de traductores antes de eliminar
-                if current_page_at_idx == self.translators_page_panel:
-                    self.notebook.RemovePage(translator_page_idx)
-
-            # Actualiza el layout del notebook después de posibles adiciones/eliminaciones
-            if self.notebook:
-                self.notebook.Layout()
-
-        # Llena la pestaña "Colaboradores"
-        collaborators_list: List[Tuple[str, Optional[str]]]
-        collaborators_list = self.info.GetCollaborators()
-        # Formatea la lista de colaboradores para mostrar nombre y contribución
-        collaborators_formatted_list: List[str]
-        collaborators_formatted_list = [f"- {name}{f': {contrib}' if contrib else ''}" for name, contrib in collaborators_list]
-        if self.collaborators_text_ctrl:
-            self.collaborators_text_ctrl.SetValue("\n".join(collaborators_formatted_list) if collaborators_formatted_list else "(Ninguno especificado)")
-            self.collaborators_text_ctrl.SetInsertionPoint(0)
-
-        # Asegura que el layout del notebook se actualice al final
-        if self.notebook:
-            self.notebook.Layout()
+        # Cada parte incluye ya sus saltos de línea previos: se unen sin separador
+        general_text_parts.append(f"\n\n{self.info.GetCopyright()}")
+        general_text_parts.append(f"\n\n\n{self.info.GetDescription()}")
+        # HasWebSite ya implica una URL no vacía
+        if self.info.HasWebSite():
+            general_text_parts.append(f"\n\n\nSitio Web: {self.info.GetWebSiteDescription()} ({self.info.GetWebSiteURL()})")
+        self._set_tab_text(TabKey.GENERAL, "".join(general_text_parts))
+
+    def _populate_licence(self):
+        """Llena la pestaña "Licencia"."""
+        self._set_tab_text(TabKey.LICENCE, self.info.GetLicence())
+
+    def _populate_developers(self):
+        """Llena la pestaña "Equipo de Desarrollo"."""
+        self._fill_list_tab(TabKey.DEVELOPERS, self.info.GetDevelopers())
+
+    def _populate_doc_writers(self):
+        """Llena la pestaña "Documentadores"."""
+        self._fill_list_tab(TabKey.DOC_WRITERS, self.info.GetDocWriters())
+
+    def _populate_artists(self):
+        """Llena la pestaña "Artistas"."""
+        self._fill_list_tab(TabKey.ARTISTS, self.info.GetArtists())
+
+    def _populate_translators(self):
+        """Llena la pestaña "Traductores" si su TextCtrl ya está construido."""
+        self._fill_list_tab(TabKey.TRANSLATORS, self.info.GetTranslators(), "")
+
+    def _populate_collaborators(self):
+        """Llena la pestaña "Colaboradores" con nombre y contribución."""
+        names: Tuple[str, ...]
+        names = self.info.GetCollaboratorNames()
+        contribs: Tuple[Optional[str], ...]
+        contribs = self.info.GetCollaboratorContributions()
+        # Formatea los colaboradores en una sola pasada, recorriendo en paralelo
+        # las listas de nombres y contribuciones sin crear una lista intermedia
+        self._set_tab_text(
+            TabKey.COLLABORATORS,
+            "\n".join(map(_format_collaborator, zip(names, contribs))) or "(Ninguno especificado)"
+        )
+
+    def on_notebook_page_changed(self, event: wx.BookCtrlEvent):
+        """
+        Manejador para el cambio de pestaña del Notebook.
+
+        Construye y llena la pestaña seleccionada si todavía era un
+        marcador de posición.
 
+        Args:
+            event (wx.BookCtrlEvent): El evento de cambio de página.
+        """
+        self._ensure_tab_built(event.GetSelection())
+        event.Skip()
 
     def on_size(self, event: wx.SizeEvent):
         """
         Manejador para el evento de cambio de tamaño del frame.
 
-        Simplemente llama a Layout() para asegurar que los controles se
-        redimensionen y reposicionen correctamente dentro del frame.
+        Programa un Layout() diferido; mientras el usuario arrastra el borde
+        cada nuevo evento reinicia la espera, de modo que solo el tamaño
+        final recalcula la disposición de los controles.
+
+        El evento no se propaga: el manejador por defecto del frame haría
+        un Layout() inmediato en cada evento y anularía la agrupación.
 
         Args:
             event (wx.SizeEvent): El evento de cambio de tamaño.
         """
+        if self._layout_timer is not None and self._layout_timer.IsRunning():
+            self._layout_timer.Restart(_RESIZE_LAYOUT_DELAY_MS)
+        else:
+            self._layout_timer = wx.CallLater(_RESIZE_LAYOUT_DELAY_MS, self._deferred_layout)
+
+    def _deferred_layout(self):
+        """
+        Realiza el layout programado por on_size, si el frame sigue existiendo.
+        """
+        self._layout_timer = None
+        if not self:
+            return
         # Realiza el layout de los controles dentro del frame
         self.Layout()
-        # Permite que el evento sea procesado por otros manejadores si los hay
-        event.Skip()
 
 
-# Bloque de ejecución principal para pruebas
-if __name__ == '__main__':
+def _main():
+    """
+    Muestra la ventana "Acerca de" con datos de prueba.
+
+    Todos los datos de prueba (incluido el texto de licencia largo) se
+    construyen aquí, solo cuando se ejecuta el módulo directamente.
+    """
     # Crea una instancia de la aplicación wx
     app = wx.App(False)
 
@@ -890,4 +1278,9 @@ if __name__ == '__main__':
     about_frame_instance.Show()
 
     # Inicia el bucle principal de eventos de wxWidgets
-    app.MainLoop()
\ No newline at end of file
+    app.MainLoop()
+
+
+# Bloque de ejecución principal para pruebas
+if __name__ == '__main__':
+    _main()
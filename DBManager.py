@@ -10,14 +10,24 @@ Licencia: MIT License
 """
 
 import sqlite3
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 from contextlib import contextmanager
+import atexit
 import os
+import threading
 
 class DatabaseError(Exception):
     """Excepción base para errores relacionados con la base de datos."""
     pass
 
+class DatabaseIntegrityError(DatabaseError, sqlite3.IntegrityError):
+    """
+    Excepción para violaciones de restricciones (UNIQUE, NOT NULL, claves foráneas).
+    Hereda también de sqlite3.IntegrityError para que los manejadores
+    'except sqlite3.IntegrityError' de cada operación la reconozcan.
+    """
+    pass
+
 class BookError(DatabaseError):
     """Excepción base para errores relacionados con operaciones de libros."""
     pass
@@ -62,11 +72,139 @@ class ConcreteIdeaError(DatabaseError):
     """Excepción base para errores relacionados con operaciones de ideas concretas."""
     pass
 
+# Sentencias SQL reutilizadas. Mantenerlas como constantes de módulo garantiza que el texto
+# sea idéntico en cada llamada, de modo que la caché de sentencias preparadas de sqlite3
+# las reutilice sin volver a analizarlas. Las sentencias con RETURNING requieren SQLite >= 3.35.
+
+# Esquema completo de la base de datos. Se ejecuta con un único executescript dentro
+# de una transacción explícita, de modo que se crea todo o nada.
+_SQL_SCHEMA_DDL = """
+    BEGIN;
+    -- Tabla 'books'
+    CREATE TABLE IF NOT EXISTS books (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL UNIQUE,
+        author TEXT NOT NULL,
+        synopsis TEXT,
+        prologue TEXT,
+        back_cover_text TEXT,
+        cover_image_path TEXT
+    );
+    -- Tabla 'chapters' con clave foránea a 'books' y restricción de unicidad.
+    -- El índice único (book_id, chapter_number) también sirve a las búsquedas por book_id.
+    CREATE TABLE IF NOT EXISTS chapters (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        book_id INTEGER NOT NULL,
+        chapter_number INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        content TEXT,
+        abstract_idea TEXT,
+        FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE,
+        UNIQUE (book_id, chapter_number)
+    );
+    -- Tabla 'concrete_ideas' con clave foránea a 'chapters'
+    CREATE TABLE IF NOT EXISTS concrete_ideas (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        chapter_id INTEGER NOT NULL,
+        idea TEXT NOT NULL,
+        FOREIGN KEY (chapter_id) REFERENCES chapters(id) ON DELETE CASCADE
+    );
+    -- Índice sobre la clave foránea: evita recorrer toda la tabla en las búsquedas por
+    -- capítulo y en cada borrado en cascada de un capítulo.
+    CREATE INDEX IF NOT EXISTS idx_concrete_ideas_chapter_id ON concrete_ideas(chapter_id);
+    COMMIT;
+"""
+_SQL_LAST_INSERT_ROWID = "SELECT last_insert_rowid()"
+_SQL_ANALYZE = "ANALYZE"
+_SQL_OPTIMIZE = "PRAGMA optimize"
+
+_SQL_INSERT_BOOK = """
+    INSERT INTO books (title, author, synopsis, prologue, back_cover_text, cover_image_path)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+# Variante para inserciones individuales; executemany no admite sentencias con RETURNING
+_SQL_INSERT_BOOK_RETURNING_ID = _SQL_INSERT_BOOK + "    RETURNING id\n"
+_SQL_SELECT_BOOK_BY_ID = "SELECT * FROM books WHERE id = ?"
+_SQL_SELECT_ALL_BOOKS = "SELECT * FROM books ORDER BY title"
+_SQL_SELECT_BOOK_WITH_CHAPTERS_AND_IDEAS = """
+    SELECT b.id, b.title, b.author, b.synopsis, b.prologue, b.back_cover_text, b.cover_image_path,
+           c.id AS chapter_id, c.chapter_number, c.title AS chapter_title, c.content, c.abstract_idea,
+           ci.id AS idea_id, ci.idea
+    FROM books b
+    LEFT JOIN chapters c ON c.book_id = b.id
+    LEFT JOIN concrete_ideas ci ON ci.chapter_id = c.id
+    WHERE b.id = ?
+    ORDER BY c.chapter_number, ci.id
+"""
+_SQL_UPDATE_BOOK = """
+    UPDATE books
+    SET title = ?, author = ?, synopsis = ?, prologue = ?, back_cover_text = ?, cover_image_path = ?
+    WHERE id = ?
+    RETURNING id
+"""
+_SQL_DELETE_BOOK = "DELETE FROM books WHERE id = ?"
+
+_SQL_INSERT_CHAPTER = """
+    INSERT INTO chapters (book_id, chapter_number, title, content, abstract_idea)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_CHAPTER_RETURNING_ID = _SQL_INSERT_CHAPTER + "    RETURNING id\n"
+_SQL_SELECT_CHAPTER_BY_ID = "SELECT * FROM chapters WHERE id = ?"
+_SQL_SELECT_CHAPTERS_BY_BOOK_ID = "SELECT * FROM chapters WHERE book_id = ? ORDER BY chapter_number"
+_SQL_UPDATE_CHAPTER = """
+    UPDATE chapters
+    SET chapter_number = ?, title = ?, content = ?, abstract_idea = ?
+    WHERE id = ?
+    RETURNING id
+"""
+_SQL_DELETE_CHAPTER = "DELETE FROM chapters WHERE id = ?"
+_SQL_UPDATE_CHAPTER_ABSTRACT_IDEA = "UPDATE chapters SET abstract_idea = ? WHERE id = ? RETURNING id"
+_SQL_UPDATE_CHAPTER_CONTENT = "UPDATE chapters SET content = ? WHERE id = ? RETURNING id"
+
+_SQL_INSERT_CONCRETE_IDEA = "INSERT INTO concrete_ideas (chapter_id, idea) VALUES (?, ?)"
+_SQL_INSERT_CONCRETE_IDEA_RETURNING_ID = _SQL_INSERT_CONCRETE_IDEA + " RETURNING id"
+_SQL_SELECT_CONCRETE_IDEAS_BY_CHAPTER_ID = "SELECT * FROM concrete_ideas WHERE chapter_id = ?"
+_SQL_UPDATE_CONCRETE_IDEA = "UPDATE concrete_ideas SET idea = ? WHERE id = ?"
+_SQL_DELETE_CONCRETE_IDEA = "DELETE FROM concrete_ideas WHERE id = ?"
+_SQL_DROP_CONCRETE_IDEAS_CHAPTER_INDEX = "DROP INDEX IF EXISTS idx_concrete_ideas_chapter_id"
+_SQL_CREATE_CONCRETE_IDEAS_CHAPTER_INDEX = "CREATE INDEX IF NOT EXISTS idx_concrete_ideas_chapter_id ON concrete_ideas(chapter_id)"
+
+class DBRow(sqlite3.Row):
+    """
+    Fila de resultado que admite acceso por nombre de columna (row['title']) y,
+    como un diccionario de solo lectura, el método get(). Evita construir un dict
+    por fila en los listados.
+    """
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Retorna el valor de la columna 'key', o 'default' si la fila no tiene esa columna.
+
+        Args:
+            key (str): El nombre de la columna.
+            default (Any, optional): El valor a retornar si la columna no existe.
+
+        Returns:
+            Any: El valor de la columna o 'default'.
+        """
+        try:
+            return self[key]
+        except IndexError:
+            # sqlite3.Row levanta IndexError para nombres de columna inexistentes
+            return default
+
+# Tamaño de la caché de sentencias preparadas por conexión (el valor por defecto de sqlite3 es 128)
+_CACHED_STATEMENTS = 256
+# Número de filas que se traen de SQLite en cada fetchmany al recorrer un listado
+_FETCH_ARRAYSIZE = 256
+
 class DBManager:
     """
     Gestiona la conexión y las operaciones CRUD (Crear, Leer, Actualizar, Eliminar)
     para las tablas de libros, capítulos e ideas concretas en una base de datos SQLite.
     Implementa el patrón Singleton para asegurar una única instancia del gestor de BD.
+    Cada hilo usa su propia conexión, ya que un sqlite3.Connection no debe compartirse
+    entre hilos.
     """
     _instance: Optional['DBManager'] = None
 
@@ -98,8 +236,14 @@ class DBManager:
             return
 
         self.db_path: str = db_path
-        self.connection: Optional[sqlite3.Connection] = None
+        # Conexión propia de cada hilo (atributo 'conn'); se abre de forma perezosa en _connect
+        self._tls: threading.local = threading.local()
+        # Registro de todas las conexiones abiertas, para poder cerrarlas desde close()
+        self._open_connections: List[sqlite3.Connection] = []
+        self._connections_lock: threading.Lock = threading.Lock()
         self._initialized_dbm: bool = True # Marca la instancia como inicializada
+        # La conexión se mantiene abierta durante toda la vida del Singleton; se cierra al salir
+        atexit.register(self.close)
 
     @classmethod
     def get_instance(cls, db_path: str) -> 'DBManager':
@@ -121,44 +265,101 @@ class DBManager:
             print(f"ADVERTENCIA: DBManager.get_instance llamado con un nuevo db_path ('{db_path}'). La instancia existente usa '{cls._instance.db_path}'.")
         return cls._instance
 
-    def _connect(self) -> None:
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Retorna la conexión del hilo actual, o None si este hilo aún no se ha conectado.
+        """
+        return getattr(self._tls, 'conn', None)
+
+    def _connect(self) -> sqlite3.Connection:
         """
-        Establece la conexión con la base de datos SQLite si no está ya conectada.
+        Establece la conexión del hilo actual con la base de datos SQLite si no está ya conectada.
+
+        Returns:
+            sqlite3.Connection: La conexión del hilo actual.
 
         Raises:
             DatabaseError: Si ocurre un error al intentar conectar con la base de datos.
         """
+        conn: Optional[sqlite3.Connection] = getattr(self._tls, 'conn', None)
+        if conn is not None:
+            return conn # Camino rápido: el hilo ya tiene una conexión abierta
         try:
-            # Conecta solo si no hay una conexión activa
-            if self.connection is None:
-                self.connection = sqlite3.connect(self.db_path)
-                # Configura la conexión para retornar filas como objetos que se pueden acceder por nombre de columna
-                self.connection.row_factory = sqlite3.Row
+            # check_same_thread=False permite que close() cierre desde el hilo principal
+            # conexiones abiertas por otros hilos; cada conexión solo se usa en su hilo.
+            conn = sqlite3.connect(self.db_path, cached_statements=_CACHED_STATEMENTS,
+                                   check_same_thread=False)
+            # Configura la conexión para retornar filas como objetos que se pueden acceder por nombre de columna
+            conn.row_factory = DBRow
+            # Aplica los PRAGMA de rendimiento una sola vez por conexión
+            # WAL evita crear/borrar el journal en cada COMMIT y permite lecturas concurrentes con escrituras
+            conn.execute("PRAGMA journal_mode=WAL")
+            # En modo WAL, NORMAL es seguro ante caídas de la aplicación y evita un fsync por COMMIT
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000") # ~64 MB de caché de páginas
+            conn.execute("PRAGMA mmap_size=268435456") # 256 MB de E/S mapeada en memoria
+            # Activa las claves foráneas para que se apliquen las restricciones ON DELETE CASCADE
+            # de create_database y se rechacen referencias a libros o capítulos inexistentes.
+            # Las filas huérfanas de bases de datos anteriores no se validan: siguen pudiendo
+            # leerse, actualizarse y eliminarse, y AUTOINCREMENT impide que se vuelvan a asociar.
+            conn.execute("PRAGMA foreign_keys=ON")
+            with self._connections_lock:
+                self._open_connections.append(conn)
+            self._tls.conn = conn
+            return conn
         except sqlite3.Error as e:
             # Envuelve el error de SQLite en una excepción personalizada
             raise DatabaseError(f"Error al conectar con la base de datos: {e}") from e
 
-    def _disconnect(self) -> None:
+    def close(self) -> None:
+        """
+        Cierra explícitamente todas las conexiones persistentes con la base de datos,
+        de cualquier hilo. Se registra con atexit para garantizar un cierre limpio al
+        terminar la aplicación.
         """
-        Cierra la conexión con la base de datos SQLite si está activa.
-        Maneja errores durante el cierre de la conexión.
+        with self._connections_lock:
+            connections: List[sqlite3.Connection] = self._open_connections
+            self._open_connections = []
+            # Un nuevo threading.local descarta las referencias de todos los hilos
+            self._tls = threading.local()
+        for conn in connections:
+            try:
+                self._close_connection(conn)
+            except sqlite3.Error as e:
+                # Imprime un mensaje de error si falla el cierre, pero no levanta excepción
+                print(f"Error al cerrar la conexión de la base de datos: {e}")
+
+    @staticmethod
+    def _close_connection(conn: sqlite3.Connection) -> None:
+        """
+        Cierra una conexión ejecutando antes PRAGMA optimize, como recomienda SQLite
+        al terminar una sesión, para que las estadísticas del planificador se mantengan
+        al día con el crecimiento de las tablas.
+
+        Args:
+            conn (sqlite3.Connection): La conexión a cerrar.
         """
         try:
-            # Cierra la conexión solo si está activa
-            if self.connection:
-                self.connection.close()
-                self.connection = None # Restablece la conexión a None
-        except sqlite3.Error as e:
-            # Imprime un mensaje de error si falla el cierre, pero no levanta excepción
-            print(f"Error al cerrar la conexión de la base de datos: {e}")
+            conn.execute(_SQL_OPTIMIZE)
+        finally:
+            conn.close()
 
     @contextmanager
-    def transaction(self):
+    def transaction(self, write: bool = True):
         """
         Proporciona un gestor de contexto para manejar transacciones de base de datos.
         Asegura que la conexión se establezca, se obtenga un cursor, se realice
         la operación, se haga commit si todo va bien, rollback en caso de error,
-        y se cierre el cursor y la conexión al finalizar.
+        y se cierre el cursor al finalizar. La conexión permanece abierta entre
+        transacciones para conservar la caché de páginas y el esquema ya analizado.
+
+        Args:
+            write (bool, optional): Si es True (por defecto), la transacción se abre con
+                BEGIN IMMEDIATE y toma el bloqueo de escritura desde el inicio, evitando
+                que falle con SQLITE_BUSY al intentar pasar de lectura a escritura. Las
+                consultas de solo lectura deben pasar False.
 
         Yields:
             sqlite3.Cursor: Un objeto cursor para ejecutar comandos SQL dentro de la transacción.
@@ -167,83 +368,62 @@ class DBManager:
             DatabaseError: Si ocurre un error durante la transacción (SQLite o personalizado).
         """
         cursor = None
+        # La conexión se guarda en una variable local para no repetir la búsqueda
+        # en el almacenamiento del hilo en cada paso de la transacción
+        conn: Optional[sqlite3.Connection] = None
         try:
-            self._connect() # Asegura que la conexión esté abierta
-            if self.connection is None:
-                 # Esto no debería ocurrir si _connect tiene éxito, pero es una salvaguarda
-                raise DatabaseError("La conexión no se pudo establecer.")
-
-            cursor = self.connection.cursor() # Obtiene un cursor
+            # _connect siempre retorna una conexión abierta o levanta DatabaseError
+            conn = self._connect()
+            cursor = conn.cursor() # Obtiene un cursor
+            if write:
+                cursor.execute("BEGIN IMMEDIATE")
             yield cursor # Cede el control al bloque 'with'
-            self.connection.commit() # Confirma los cambios si no hubo errores
+            conn.commit() # Confirma los cambios si no hubo errores
+        except sqlite3.IntegrityError as e_int:
+            # Violación de una restricción: rollback y se relanza con un tipo que los
+            # manejadores de cada operación distinguen de los demás errores
+            if conn:
+                conn.rollback()
+            raise DatabaseIntegrityError(f"Error de integridad durante la transacción: {e_int}") from e_int
         except sqlite3.Error as e_sql:
             # Si ocurre un error de SQLite, intenta hacer rollback
-            if self.connection:
-                self.connection.rollback()
+            if conn:
+                conn.rollback()
             # Envuelve el error de SQLite en una excepción personalizada y la relanza
             raise DatabaseError(f"Error SQLite durante la transacción: {e_sql}") from e_sql
         except DatabaseError:
             # Si ocurre una excepción DatabaseError personalizada, intenta hacer rollback
-            if self.connection:
-                self.connection.rollback()
+            if conn:
+                conn.rollback()
             raise # Relanza la excepción original
         except Exception as e_gen:
             # Captura cualquier otra excepción inesperada, intenta hacer rollback
-            if self.connection:
-                self.connection.rollback()
+            if conn:
+                conn.rollback()
             # Envuelve la excepción genérica en una DatabaseError y la relanza
             raise DatabaseError(f"Error inesperado durante la transacción: {e_gen}") from e_gen
         finally:
             # Asegura que el cursor se cierre
             if cursor:
                 cursor.close()
-            self._disconnect() # Asegura que la conexión se cierre
 
     def create_database(self) -> None:
         """
-        Crea las tablas 'books', 'chapters' y 'concrete_ideas' en la base de datos
-        si no existen.
+        Crea las tablas 'books', 'chapters' y 'concrete_ideas', y sus índices,
+        en la base de datos si no existen.
 
         Raises:
             DatabaseError: Si ocurre un error durante la creación de las tablas.
         """
         try:
-            # Usa el gestor de contexto para una transacción segura
-            with self.transaction() as cursor:
-                # Crea la tabla 'books'
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS books (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        title TEXT NOT NULL UNIQUE,
-                        author TEXT NOT NULL,
-                        synopsis TEXT,
-                        prologue TEXT,
-                        back_cover_text TEXT,
-                        cover_image_path TEXT
-                    )
-                """)
-                # Crea la tabla 'chapters' con clave foránea a 'books' y restricción de unicidad
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS chapters (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        book_id INTEGER NOT NULL,
-                        chapter_number INTEGER NOT NULL,
-                        title TEXT NOT NULL,
-                        content TEXT,
-                        abstract_idea TEXT,
-                        FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE,
-                        UNIQUE (book_id, chapter_number)
-                    )
-                """)
-                # Crea la tabla 'concrete_ideas' con clave foránea a 'chapters'
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS concrete_ideas (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        chapter_id INTEGER NOT NULL,
-                        idea TEXT NOT NULL,
-                        FOREIGN KEY (chapter_id) REFERENCES chapters(id) ON DELETE CASCADE
-                    )
-                """)
+            # Usa el gestor de contexto para una transacción segura. El script abre su
+            # propia transacción (BEGIN ... COMMIT), por lo que no se inicia otra aquí.
+            with self.transaction(write=False) as cursor:
+                # Crea todas las tablas e índices en una sola llamada
+                cursor.executescript(_SQL_SCHEMA_DDL)
+                # Refresca las estadísticas del planificador solo si están desactualizadas;
+                # a diferencia de ANALYZE, no recorre todas las tablas en cada arranque
+                cursor.execute(_SQL_OPTIMIZE)
             print(f"Base de datos '{self.db_path}' verificada/inicializada con éxito.")
         except DatabaseError as e:
             # Captura y relanza errores específicos de la base de datos
@@ -268,17 +448,15 @@ class DBManager:
             BookCreationError: Si ocurre un error durante la creación del libro,
                                incluyendo errores de integridad (título duplicado).
         """
-        query = """
-            INSERT INTO books (title, author, synopsis, prologue, back_cover_text, cover_image_path)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """
         params = (title, author, synopsis, prologue, back_cover_text, cover_image_path)
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, params)
-                book_id = cursor.lastrowid # Obtiene el ID de la última fila insertada
+                cursor.execute(_SQL_INSERT_BOOK_RETURNING_ID, params)
+                # RETURNING id entrega el ID generado junto con la propia inserción
+                inserted_row = cursor.fetchone()
+                book_id = inserted_row[0] if inserted_row else None
             if book_id is None:
-                # Si lastrowid es None, la inserción falló de alguna manera inesperada
+                # Si no se obtuvo el ID, la inserción falló de alguna manera inesperada
                 raise BookCreationError(f"No se pudo obtener el ID para el libro: '{title}'")
             return book_id
         except sqlite3.IntegrityError as e_int:
@@ -288,6 +466,50 @@ class DBManager:
             # Captura otros errores de base de datos durante la creación
             raise BookCreationError(f"Error de base de datos al crear el libro '{title}': {e}") from e
 
+    def _insert_many(self, cursor: sqlite3.Cursor, query: str, rows: List[Tuple[Any, ...]]) -> List[int]:
+        """
+        Inserta varias filas con un único executemany y calcula sus IDs.
+        Debe llamarse dentro de una transacción ya abierta.
+
+        Args:
+            cursor (sqlite3.Cursor): El cursor de la transacción en curso.
+            query (str): La sentencia INSERT parametrizada.
+            rows (List[Tuple[Any, ...]]): Las filas a insertar.
+
+        Returns:
+            List[int]: Los IDs asignados a cada fila, en el mismo orden que 'rows'.
+        """
+        cursor.executemany(query, rows)
+        cursor.execute(_SQL_LAST_INSERT_ROWID)
+        last_id: int = cursor.fetchone()[0]
+        # AUTOINCREMENT asigna IDs consecutivos dentro de un mismo executemany en esta conexión
+        first_id: int = last_id - len(rows) + 1
+        return list(range(first_id, last_id + 1))
+
+    def create_books_bulk(self, rows: Iterable[Tuple[str, str, str, str, str, str]]) -> List[int]:
+        """
+        Crea varios libros en una única transacción.
+
+        Args:
+            rows (Iterable[Tuple[str, str, str, str, str, str]]): Tuplas con
+                (title, author, synopsis, prologue, back_cover_text, cover_image_path).
+
+        Returns:
+            List[int]: Los IDs de los libros creados, en el mismo orden que 'rows'.
+
+        Raises:
+            BookCreationError: Si ocurre un error durante la creación de alguno de los libros.
+                               En ese caso no se inserta ninguno.
+        """
+        rows_list: List[Tuple[str, str, str, str, str, str]] = list(rows)
+        if not rows_list:
+            return []
+        try:
+            with self.transaction() as cursor:
+                return self._insert_many(cursor, _SQL_INSERT_BOOK, rows_list)
+        except DatabaseError as e:
+            raise BookCreationError(f"Error de base de datos al crear {len(rows_list)} libros en bloque: {e}") from e
+
     def get_book_by_id(self, book_id: int) -> Optional[Dict[str, Any]]:
         """
         Recupera los datos de un libro por su ID.
@@ -303,10 +525,9 @@ class DBManager:
             BookNotFoundError: Si el libro con el ID especificado no es encontrado.
             DatabaseError: Si ocurre un error de base de datos diferente a BookNotFoundError.
         """
-        query = "SELECT * FROM books WHERE id = ?"
         try:
-            with self.transaction() as cursor:
-                cursor.execute(query, (book_id,))
+            with self.transaction(write=False) as cursor:
+                cursor.execute(_SQL_SELECT_BOOK_BY_ID, (book_id,))
                 book_data = cursor.fetchone() # Obtiene una única fila
             if book_data:
                 return dict(book_data) # Convierte la fila (Row) a diccionario
@@ -318,23 +539,107 @@ class DBManager:
                 print(f"Error de base de datos al obtener libro con ID {book_id}: {e}")
             raise
 
-    def get_all_books(self) -> List[Dict[str, Any]]:
+    def get_book_with_chapters_and_ideas(self, book_id: int) -> Dict[str, Any]:
+        """
+        Recupera un libro junto con todos sus capítulos y las ideas concretas de cada
+        capítulo en una sola consulta, en lugar de una consulta para el libro, otra para
+        sus capítulos y una más por cada capítulo para sus ideas.
+
+        Args:
+            book_id (int): El ID del libro a recuperar.
+
+        Returns:
+            Dict[str, Any]: Un diccionario con los datos del libro y la clave 'chapters',
+                            una lista de diccionarios de capítulos ordenados por número.
+                            Cada capítulo incluye la clave 'concrete_ideas', una lista de
+                            diccionarios de ideas con 'id', 'chapter_id' e 'idea'.
+
+        Raises:
+            BookNotFoundError: Si el libro con el ID especificado no es encontrado.
+            DatabaseError: Si ocurre un error de base de datos diferente a BookNotFoundError.
+        """
+        try:
+            with self.transaction(write=False) as cursor:
+                cursor.execute(_SQL_SELECT_BOOK_WITH_CHAPTERS_AND_IDEAS, (book_id,))
+                rows: List[DBRow] = cursor.fetchall()
+            if not rows:
+                raise BookNotFoundError(f"Libro con ID {book_id} no encontrado.")
+
+            # Los datos del libro se repiten en cada fila; se toman de la primera
+            first: DBRow = rows[0]
+            chapters: List[Dict[str, Any]] = []
+            book: Dict[str, Any] = {
+                'id': first['id'],
+                'title': first['title'],
+                'author': first['author'],
+                'synopsis': first['synopsis'],
+                'prologue': first['prologue'],
+                'back_cover_text': first['back_cover_text'],
+                'cover_image_path': first['cover_image_path'],
+                'chapters': chapters,
+            }
+            # Agrupa las filas por capítulo; llegan ordenadas, así que basta con
+            # detectar el cambio de capítulo
+            current_chapter_id: Optional[int] = None
+            current_ideas: List[Dict[str, Any]] = []
+            for row in rows:
+                chapter_id: Optional[int] = row['chapter_id']
+                if chapter_id is None:
+                    continue # Libro sin capítulos (LEFT JOIN sin coincidencias)
+                if chapter_id != current_chapter_id:
+                    current_chapter_id = chapter_id
+                    current_ideas = []
+                    chapters.append({
+                        'id': chapter_id,
+                        'book_id': first['id'],
+                        'chapter_number': row['chapter_number'],
+                        'title': row['chapter_title'],
+                        'content': row['content'],
+                        'abstract_idea': row['abstract_idea'],
+                        'concrete_ideas': current_ideas,
+                    })
+                if row['idea_id'] is not None:
+                    current_ideas.append({'id': row['idea_id'], 'chapter_id': chapter_id, 'idea': row['idea']})
+            return book
+        except DatabaseError as e:
+            # Relanza la excepción si es BookNotFoundError, de lo contrario, imprime y relanza
+            if not isinstance(e, BookNotFoundError):
+                print(f"Error de base de datos al obtener libro completo con ID {book_id}: {e}")
+            raise
+
+    def get_all_books(self) -> List[DBRow]:
         """
         Recupera los datos de todos los libros en la base de datos, ordenados por título.
 
         Returns:
-            List[Dict[str, Any]]: Una lista de diccionarios, donde cada diccionario
-                                  representa un libro. Retorna una lista vacía si no hay libros.
+            List[DBRow]: Una lista de filas de solo lectura, accesibles por nombre de columna,
+                         donde cada fila representa un libro. Retorna una lista vacía si no hay libros.
+
+        Raises:
+            DatabaseError: Si ocurre un error al recuperar los libros.
+        """
+        # Las filas DBRow se retornan tal cual, sin copiarlas a diccionarios
+        return list(self.iter_books())
+
+    def iter_books(self) -> Iterator[DBRow]:
+        """
+        Recorre los libros de la base de datos, ordenados por título, trayéndolos
+        por bloques en lugar de materializar todo el resultado de una vez.
+
+        Yields:
+            DBRow: Una fila de solo lectura por cada libro.
 
         Raises:
             DatabaseError: Si ocurre un error al recuperar los libros.
         """
         try:
-            with self.transaction() as cursor:
-                cursor.execute("SELECT * FROM books ORDER BY title")
-                books_data = cursor.fetchall() # Obtiene todas las filas
-            # Convierte cada fila (Row) a diccionario y retorna la lista
-            return [dict(book) for book in books_data]
+            with self.transaction(write=False) as cursor:
+                cursor.arraysize = _FETCH_ARRAYSIZE
+                cursor.execute(_SQL_SELECT_ALL_BOOKS)
+                rows: List[DBRow] = cursor.fetchmany()
+                while rows:
+                    yield from rows
+                    rows = cursor.fetchmany()
         except DatabaseError as e:
             # Captura y relanza errores de base de datos
             raise DatabaseError(f"Error al obtener todos los libros: {e}") from e
@@ -360,27 +665,15 @@ class DBManager:
             BookUpdateError: Si ocurre un error durante la actualización,
                              incluyendo errores de integridad (título duplicado).
         """
-        query = """
-            UPDATE books
-            SET title = ?, author = ?, synopsis = ?, prologue = ?, back_cover_text = ?, cover_image_path = ?
-            WHERE id = ?
-        """
         params = (title, author, synopsis, prologue, back_cover_text, cover_image_path, book_id)
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, params)
-                # Verifica cuántas filas fueron afectadas por la actualización
-                if cursor.rowcount == 0:
-                    # Si rowcount es 0, el libro con ese ID no existía o los datos eran idénticos.
-                    # Realizamos una verificación explícita para distinguir.
-                    check_cursor = cursor.connection.cursor()
-                    check_cursor.execute("SELECT 1 FROM books WHERE id = ?", (book_id,))
-                    # Si fetchone() retorna None, el libro no existe
-                    if not check_cursor.fetchone():
-                        raise BookNotFoundError(f"No se pudo actualizar: Libro con ID {book_id} no encontrado.")
-                    # Si fetchone() retorna algo, el libro existe pero los datos no cambiaron.
-                    # En este caso, consideramos la operación exitosa (el estado deseado ya existe).
-            return True # Retorna True si la actualización afectó al menos una fila o si el libro existía pero no cambió
+                cursor.execute(_SQL_UPDATE_BOOK, params)
+                # RETURNING id devuelve una fila por cada registro que coincide con el WHERE,
+                # aunque los datos no cambien; si no devuelve ninguna, el libro no existe.
+                if cursor.fetchone() is None:
+                    raise BookNotFoundError(f"No se pudo actualizar: Libro con ID {book_id} no encontrado.")
+            return True # Retorna True si el libro existía, hayan cambiado o no sus datos
         except sqlite3.IntegrityError as e_int:
             # Captura errores de unicidad (título duplicado) u otros errores de integridad
             raise BookUpdateError(f"Error de integridad al actualizar libro con ID {book_id}: {e_int}") from e_int
@@ -406,7 +699,7 @@ class DBManager:
         """
         try:
             with self.transaction() as cursor:
-                cursor.execute("DELETE FROM books WHERE id = ?", (book_id,))
+                cursor.execute(_SQL_DELETE_BOOK, (book_id,))
                 # Verifica cuántas filas fueron afectadas por la eliminación
                 if cursor.rowcount == 0:
                     # Si rowcount es 0, el libro con ese ID no existía
@@ -436,17 +729,15 @@ class DBManager:
                                   incluyendo errores de integridad (book_id inexistente
                                   o (book_id, chapter_number) duplicado).
         """
-        query = """
-            INSERT INTO chapters (book_id, chapter_number, title, content, abstract_idea)
-            VALUES (?, ?, ?, ?, ?)
-        """
         params = (book_id, chapter_number, title, content, abstract_idea)
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, params)
-                chapter_id = cursor.lastrowid # Obtiene el ID de la última fila insertada
+                cursor.execute(_SQL_INSERT_CHAPTER_RETURNING_ID, params)
+                # RETURNING id entrega el ID generado junto con la propia inserción
+                inserted_row = cursor.fetchone()
+                chapter_id = inserted_row[0] if inserted_row else None
                 if chapter_id is None:
-                    # Si lastrowid es None, la inserción falló de alguna manera inesperada
+                    # Si no se obtuvo el ID, la inserción falló de alguna manera inesperada
                     raise ChapterCreationError(f"No se pudo obtener ID para capítulo (libro ID {book_id}, N°{chapter_number})")
                 return chapter_id
         except sqlite3.IntegrityError as e_int:
@@ -456,6 +747,30 @@ class DBManager:
             # Captura otros errores de base de datos durante la creación
             raise ChapterCreationError(f"Error de base de datos al crear capítulo: {e}") from e
 
+    def create_chapters_bulk(self, rows: Iterable[Tuple[int, int, str, str, str]]) -> List[int]:
+        """
+        Crea varios capítulos en una única transacción.
+
+        Args:
+            rows (Iterable[Tuple[int, int, str, str, str]]): Tuplas con
+                (book_id, chapter_number, title, content, abstract_idea).
+
+        Returns:
+            List[int]: Los IDs de los capítulos creados, en el mismo orden que 'rows'.
+
+        Raises:
+            ChapterCreationError: Si ocurre un error durante la creación de alguno de los capítulos.
+                                  En ese caso no se inserta ninguno.
+        """
+        rows_list: List[Tuple[int, int, str, str, str]] = list(rows)
+        if not rows_list:
+            return []
+        try:
+            with self.transaction() as cursor:
+                return self._insert_many(cursor, _SQL_INSERT_CHAPTER, rows_list)
+        except DatabaseError as e:
+            raise ChapterCreationError(f"Error de base de datos al crear {len(rows_list)} capítulos en bloque: {e}") from e
+
     def get_chapter_by_id(self, chapter_id: int) -> Optional[Dict[str, Any]]:
         """
         Recupera los datos de un capítulo por su ID.
@@ -471,10 +786,9 @@ class DBManager:
             ChapterNotFoundError: Si el capítulo con el ID especificado no es encontrado.
             DatabaseError: Si ocurre un error de base de datos diferente a ChapterNotFoundError.
         """
-        query = "SELECT * FROM chapters WHERE id = ?"
         try:
-            with self.transaction() as cursor:
-                cursor.execute(query, (chapter_id,))
+            with self.transaction(write=False) as cursor:
+                cursor.execute(_SQL_SELECT_CHAPTER_BY_ID, (chapter_id,))
                 chapter_data = cursor.fetchone() # Obtiene una única fila
             if chapter_data:
                 return dict(chapter_data) # Convierte la fila (Row) a diccionario
@@ -486,7 +800,7 @@ class DBManager:
                 print(f"Error de base de datos al obtener capítulo con ID {chapter_id}: {e}")
             raise
 
-    def get_chapters_by_book_id(self, book_id: int) -> List[Dict[str, Any]]:
+    def get_chapters_by_book_id(self, book_id: int) -> List[DBRow]:
         """
         Recupera todos los capítulos asociados a un libro específico, ordenados por número de capítulo.
 
@@ -494,20 +808,38 @@ class DBManager:
             book_id (int): El ID del libro cuyos capítulos se desean recuperar.
 
         Returns:
-            List[Dict[str, Any]]: Una lista de diccionarios, donde cada diccionario
-                                  representa un capítulo. Retorna una lista vacía si el libro
-                                  no tiene capítulos o si el libro no existe.
+            List[DBRow]: Una lista de filas de solo lectura, accesibles por nombre de columna,
+                         donde cada fila representa un capítulo. Retorna una lista vacía si el libro
+                         no tiene capítulos o si el libro no existe.
+
+        Raises:
+            DatabaseError: Si ocurre un error al recuperar los capítulos.
+        """
+        # Las filas DBRow se retornan tal cual, sin copiarlas a diccionarios
+        return list(self.iter_chapters_by_book_id(book_id))
+
+    def iter_chapters_by_book_id(self, book_id: int) -> Iterator[DBRow]:
+        """
+        Recorre los capítulos de un libro, ordenados por número de capítulo,
+        trayéndolos por bloques en lugar de materializar todo el resultado de una vez.
+
+        Args:
+            book_id (int): El ID del libro cuyos capítulos se desean recorrer.
+
+        Yields:
+            DBRow: Una fila de solo lectura por cada capítulo.
 
         Raises:
             DatabaseError: Si ocurre un error al recuperar los capítulos.
         """
-        query = "SELECT * FROM chapters WHERE book_id = ? ORDER BY chapter_number"
         try:
-            with self.transaction() as cursor:
-                cursor.execute(query, (book_id,))
-                chapters_data = cursor.fetchall() # Obtiene todas las filas
-            # Convierte cada fila (Row) a diccionario y retorna la lista
-            return [dict(chapter) for chapter in chapters_data]
+            with self.transaction(write=False) as cursor:
+                cursor.arraysize = _FETCH_ARRAYSIZE
+                cursor.execute(_SQL_SELECT_CHAPTERS_BY_BOOK_ID, (book_id,))
+                rows: List[DBRow] = cursor.fetchmany()
+                while rows:
+                    yield from rows
+                    rows = cursor.fetchmany()
         except DatabaseError as e:
             # Captura y relanza errores de base de datos
             raise DatabaseError(f"Error de base de datos al obtener capítulos para libro con ID {book_id}: {e}") from e
@@ -531,27 +863,15 @@ class DBManager:
             ChapterUpdateError: Si ocurre un error durante la actualización,
                                 incluyendo errores de integridad ((book_id, chapter_number) duplicado).
         """
-        query = """
-            UPDATE chapters
-            SET chapter_number = ?, title = ?, content = ?, abstract_idea = ?
-            WHERE id = ?
-        """
         params = (chapter_number, title, content, abstract_idea, chapter_id)
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, params)
-                # Verifica cuántas filas fueron afectadas por la actualización
-                if cursor.rowcount == 0:
-                    # Si rowcount es 0, el capítulo con ese ID no existía o los datos eran idénticos.
-                    # Realizamos una verificación explícita para distinguir.
-                    check_cursor = cursor.connection.cursor()
-                    check_cursor.execute("SELECT 1 FROM chapters WHERE id = ?", (chapter_id,))
-                    # Si fetchone() retorna None, el capítulo no existe
-                    if not check_cursor.fetchone():
-                        raise ChapterNotFoundError(f"No se pudo actualizar: Capítulo con ID {chapter_id} no encontrado.")
-                    # Si fetchone() retorna algo, el capítulo existe pero los datos no cambiaron.
-                    # En este caso, consideramos la operación exitosa.
-            return True # Retorna True si la actualización afectó al menos una fila o si el capítulo existía pero no cambió
+                cursor.execute(_SQL_UPDATE_CHAPTER, params)
+                # RETURNING id devuelve una fila por cada registro que coincide con el WHERE,
+                # aunque los datos no cambien; si no devuelve ninguna, el capítulo no existe.
+                if cursor.fetchone() is None:
+                    raise ChapterNotFoundError(f"No se pudo actualizar: Capítulo con ID {chapter_id} no encontrado.")
+            return True # Retorna True si el capítulo existía, hayan cambiado o no sus datos
         except sqlite3.IntegrityError as e_int:
             # Captura errores de unicidad ((book_id, chapter_number) duplicado) u otros errores de integridad
             raise ChapterUpdateError(f"Error de integridad al actualizar capítulo con ID {chapter_id}: {e_int}") from e_int
@@ -575,10 +895,9 @@ class DBManager:
             ChapterNotFoundError: Si el capítulo con el ID especificado no es encontrado.
             ChapterDeletionError: Si ocurre un error de base de datos durante la eliminación.
         """
-        query = "DELETE FROM chapters WHERE id = ?"
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, (chapter_id,))
+                cursor.execute(_SQL_DELETE_CHAPTER, (chapter_id,))
                 # Verifica cuántas filas fueron afectadas por la eliminación
                 if cursor.rowcount == 0:
                     # Si rowcount es 0, el capítulo con ese ID no existía
@@ -606,17 +925,12 @@ class DBManager:
             ChapterNotFoundError: Si el capítulo con el ID especificado no es encontrado.
             ChapterUpdateError: Si ocurre un error de base de datos durante la actualización.
         """
-        query = "UPDATE chapters SET abstract_idea = ? WHERE id = ?"
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, (abstract_idea, chapter_id))
-                # Verifica si se afectó alguna fila. Si no, puede ser que el ID no exista
-                # o que el valor ya fuera el mismo. Verificamos si el ID existe.
-                if cursor.rowcount == 0:
-                    check_cursor = cursor.connection.cursor()
-                    check_cursor.execute("SELECT 1 FROM chapters WHERE id = ?", (chapter_id,))
-                    if not check_cursor.fetchone():
-                        raise ChapterNotFoundError(f"No se actualizó idea abstracta: Capítulo con ID {chapter_id} no encontrado.")
+                cursor.execute(_SQL_UPDATE_CHAPTER_ABSTRACT_IDEA, (abstract_idea, chapter_id))
+                # Sin fila devuelta por RETURNING, el capítulo con ese ID no existe
+                if cursor.fetchone() is None:
+                    raise ChapterNotFoundError(f"No se actualizó idea abstracta: Capítulo con ID {chapter_id} no encontrado.")
             return True # Retorna True si se actualizó o si el capítulo existía pero el valor no cambió
         except DatabaseError as e:
             # Captura y relanza errores de base de datos durante la actualización
@@ -638,17 +952,12 @@ class DBManager:
             ChapterNotFoundError: Si el capítulo con el ID especificado no es encontrado.
             ChapterUpdateError: Si ocurre un error de base de datos durante la actualización.
         """
-        query = "UPDATE chapters SET content = ? WHERE id = ?"
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, (content, chapter_id))
-                # Verifica si se afectó alguna fila. Si no, puede ser que el ID no exista
-                # o que el valor ya fuera el mismo. Verificamos si el ID existe.
-                if cursor.rowcount == 0:
-                    check_cursor = cursor.connection.cursor()
-                    check_cursor.execute("SELECT 1 FROM chapters WHERE id = ?", (chapter_id,))
-                    if not check_cursor.fetchone():
-                        raise ChapterNotFoundError(f"No se actualizó contenido: Capítulo con ID {chapter_id} no encontrado.")
+                cursor.execute(_SQL_UPDATE_CHAPTER_CONTENT, (content, chapter_id))
+                # Sin fila devuelta por RETURNING, el capítulo con ese ID no existe
+                if cursor.fetchone() is None:
+                    raise ChapterNotFoundError(f"No se actualizó contenido: Capítulo con ID {chapter_id} no encontrado.")
             return True # Retorna True si se actualizó o si el capítulo existía pero el valor no cambió
         except DatabaseError as e:
             # Captura y relanza errores de base de datos durante la actualización
@@ -669,13 +978,14 @@ class DBManager:
             ConcreteIdeaError: Si ocurre un error durante la adición de la idea concreta,
                                incluyendo errores de integridad (chapter_id inexistente).
         """
-        query = "INSERT INTO concrete_ideas (chapter_id, idea) VALUES (?, ?)"
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, (chapter_id, idea))
-                idea_id = cursor.lastrowid # Obtiene el ID de la última fila insertada
+                cursor.execute(_SQL_INSERT_CONCRETE_IDEA_RETURNING_ID, (chapter_id, idea))
+                # RETURNING id entrega el ID generado junto con la propia inserción
+                inserted_row = cursor.fetchone()
+                idea_id = inserted_row[0] if inserted_row else None
             if idea_id is None:
-                # Si lastrowid es None, la inserción falló de alguna manera inesperada
+                # Si no se obtuvo el ID, la inserción falló de alguna manera inesperada
                 raise ConcreteIdeaError(f"No se pudo obtener ID para idea concreta para capítulo ID {chapter_id}")
             return idea_id
         except sqlite3.IntegrityError as e_int:
@@ -685,7 +995,86 @@ class DBManager:
             # Captura otros errores de base de datos durante la adición
             raise ConcreteIdeaError(f"Error de base de datos al añadir idea concreta: {e}") from e
 
-    def get_concrete_ideas_by_chapter_id(self, chapter_id: int) -> List[Dict[str, Any]]:
+    def add_concrete_ideas_bulk(self, rows: Iterable[Tuple[int, str]]) -> List[int]:
+        """
+        Añade varias ideas concretas en una única transacción.
+
+        Args:
+            rows (Iterable[Tuple[int, str]]): Tuplas con (chapter_id, idea).
+
+        Returns:
+            List[int]: Los IDs de las ideas concretas creadas, en el mismo orden que 'rows'.
+
+        Raises:
+            ConcreteIdeaError: Si ocurre un error durante la adición de alguna de las ideas.
+                               En ese caso no se inserta ninguna.
+        """
+        rows_list: List[Tuple[int, str]] = list(rows)
+        if not rows_list:
+            return []
+        try:
+            with self.transaction() as cursor:
+                return self._insert_many(cursor, _SQL_INSERT_CONCRETE_IDEA, rows_list)
+        except DatabaseError as e:
+            raise ConcreteIdeaError(f"Error de base de datos al añadir {len(rows_list)} ideas concretas en bloque: {e}") from e
+
+    def bulk_load(self, books: Iterable[Tuple[str, str, str, str, str, str]],
+                  chapters: Iterable[Tuple[int, int, str, str, str]],
+                  ideas: Iterable[Tuple[int, str]]) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Importa en una única transacción un conjunto de libros con sus capítulos
+        e ideas concretas (por ejemplo, al restaurar un catálogo). El índice sobre
+        concrete_ideas.chapter_id se elimina durante la carga y se reconstruye una
+        sola vez al final, en lugar de mantenerlo fila a fila. Los índices UNIQUE
+        de books y chapters no pueden eliminarse en SQLite y se mantienen.
+
+        Args:
+            books (Iterable[Tuple[str, str, str, str, str, str]]): Tuplas con
+                (title, author, synopsis, prologue, back_cover_text, cover_image_path).
+            chapters (Iterable[Tuple[int, int, str, str, str]]): Tuplas con
+                (book_index, chapter_number, title, content, abstract_idea), donde
+                book_index es la posición del libro dentro de 'books'.
+            ideas (Iterable[Tuple[int, str]]): Tuplas con (chapter_index, idea), donde
+                chapter_index es la posición del capítulo dentro de 'chapters'.
+
+        Returns:
+            Tuple[List[int], List[int], List[int]]: Los IDs de los libros, capítulos
+                e ideas creados, cada lista en el mismo orden que su entrada.
+
+        Raises:
+            DatabaseError: Si ocurre un error durante la carga. En ese caso no se
+                           inserta nada y el índice se conserva.
+        """
+        books_list: List[Tuple[str, str, str, str, str, str]] = list(books)
+        chapters_list: List[Tuple[int, int, str, str, str]] = list(chapters)
+        ideas_list: List[Tuple[int, str]] = list(ideas)
+        book_ids: List[int] = []
+        chapter_ids: List[int] = []
+        idea_ids: List[int] = []
+        try:
+            with self.transaction() as cursor:
+                if books_list:
+                    book_ids = self._insert_many(cursor, _SQL_INSERT_BOOK, books_list)
+                if chapters_list:
+                    # Traduce la posición del libro en 'books' a su ID real
+                    chapter_ids = self._insert_many(cursor, _SQL_INSERT_CHAPTER,
+                                                    [(book_ids[book_index], number, title, content, abstract_idea)
+                                                     for book_index, number, title, content, abstract_idea in chapters_list])
+                if ideas_list:
+                    # El DDL es transaccional en SQLite: un error deshace también el DROP
+                    cursor.execute(_SQL_DROP_CONCRETE_IDEAS_CHAPTER_INDEX)
+                    idea_ids = self._insert_many(cursor, _SQL_INSERT_CONCRETE_IDEA,
+                                                 [(chapter_ids[chapter_index], idea)
+                                                  for chapter_index, idea in ideas_list])
+                    cursor.execute(_SQL_CREATE_CONCRETE_IDEAS_CHAPTER_INDEX)
+                # Tras una carga masiva las estadísticas quedan obsoletas; se recalculan
+                # para que el planificador siga eligiendo los índices
+                cursor.execute(_SQL_ANALYZE)
+            return book_ids, chapter_ids, idea_ids
+        except DatabaseError as e:
+            raise DatabaseError(f"Error de base de datos durante la carga masiva: {e}") from e
+
+    def get_concrete_ideas_by_chapter_id(self, chapter_id: int) -> List[DBRow]:
         """
         Recupera todas las ideas concretas asociadas a un capítulo específico.
 
@@ -693,20 +1082,19 @@ class DBManager:
             chapter_id (int): El ID del capítulo cuyas ideas concretas se desean recuperar.
 
         Returns:
-            List[Dict[str, Any]]: Una lista de diccionarios, donde cada diccionario
-                                  representa una idea concreta. Retorna una lista vacía
-                                  si el capítulo no tiene ideas concretas o si el capítulo no existe.
+            List[DBRow]: Una lista de filas de solo lectura, accesibles por nombre de columna,
+                         donde cada fila representa una idea concreta. Retorna una lista vacía
+                         si el capítulo no tiene ideas concretas o si el capítulo no existe.
 
         Raises:
             ConcreteIdeaError: Si ocurre un error al recuperar las ideas concretas.
         """
-        query = "SELECT * FROM concrete_ideas WHERE chapter_id = ?"
         try:
-            with self.transaction() as cursor:
-                cursor.execute(query, (chapter_id,))
+            with self.transaction(write=False) as cursor:
+                cursor.execute(_SQL_SELECT_CONCRETE_IDEAS_BY_CHAPTER_ID, (chapter_id,))
                 ideas_data = cursor.fetchall() # Obtiene todas las filas
-            # Convierte cada fila (Row) a diccionario y retorna la lista
-            return [dict(idea) for idea in ideas_data]
+            # Las filas DBRow se retornan tal cual, sin copiarlas a diccionarios
+            return ideas_data
         except DatabaseError as e:
             # Captura y relanza errores de base de datos
             raise ConcreteIdeaError(f"Error de base de datos al obtener ideas concretas para capítulo ID {chapter_id}: {e}") from e
@@ -727,10 +1115,9 @@ class DBManager:
             ConcreteIdeaError: Si ocurre un error de base de datos durante la actualización.
                                (No levanta error si la idea_id no existe, solo si hay un error de BD).
         """
-        query = "UPDATE concrete_ideas SET idea = ? WHERE id = ?"
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, (idea_text, idea_id))
+                cursor.execute(_SQL_UPDATE_CONCRETE_IDEA, (idea_text, idea_id))
                 # No verificamos cursor.rowcount == 0 aquí, ya que actualizar a un valor idéntico
                 # resulta en rowcount == 0 pero no es un error. Si el ID no existe, la operación
                 # simplemente no afecta ninguna fila, lo cual puede ser aceptable dependiendo del caso de uso.
@@ -754,10 +1141,9 @@ class DBManager:
             ConcreteIdeaError: Si la idea concreta con el ID especificado no es encontrada
                                o si ocurre un error de base de datos durante la eliminación.
         """
-        query = "DELETE FROM concrete_ideas WHERE id = ?"
         try:
             with self.transaction() as cursor:
-                cursor.execute(query, (idea_id,))
+                cursor.execute(_SQL_DELETE_CONCRETE_IDEA, (idea_id,))
                 # Verifica cuántas filas fueron afectadas por la eliminación
                 if cursor.rowcount == 0:
                     # Si rowcount es 0, la idea concreta con ese ID no existía
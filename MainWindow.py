@@ -1112,6 +1112,9 @@ class MainWindow(wx.Frame):
                     wx.MessageBox("No se pudieron guardar los detalles del libro. No se puede continuar a la edición de capítulos.",
                                   "Error de Guardado", wx.OK | wx.ICON_ERROR, self)
                     return
+                # El título pudo cambiar: descarta el título en caché de la lista de capítulos
+                if self.chapter_list_view:
+                    self.chapter_list_view.invalidate_book_title(self.current_book_id)
             elif result == wx.ID_CANCEL:
                 return
             else:
@@ -1313,6 +1316,9 @@ class MainWindow(wx.Frame):
                     all_saves_successful = False
                 else:
                     something_was_dirty_and_saved = True
+                    # El título pudo cambiar: descarta el título en caché de la lista de capítulos
+                    if self.chapter_list_view:
+                        self.chapter_list_view.invalidate_book_title(self.current_book_id)
         # Guardar contenido/idea abstracta del capítulo si estamos en modo edición
         elif self.current_app_state == STATE_BOOK_EDIT_MODE:
             if self.current_chapter_id: